@@ -4,22 +4,38 @@ Manages event handlers and dispatches domain events to registered handlers.
 Supports both synchronous and asynchronous handler functions.
 """
 
+import asyncio
 import inspect
+import logging
 from collections.abc import Callable
 
 from src.application.interfaces import IEventDispatcher
 from src.domain.events import DomainEvent
 
+logger = logging.getLogger(__name__)
+
 
 class EventDispatcher(IEventDispatcher):
     """Concrete implementation of IEventDispatcher.
 
     Manages event handlers and dispatches domain events to registered handlers.
     Handlers can be either synchronous or asynchronous callables.
+    Whether a handler is a coroutine function is determined once at registration
+    time so that dispatch does not need to introspect handlers.
+
+    Handlers registered for a base event type also receive events of its
+    subclasses. The merged handler list for each concrete event type is
+    resolved from its MRO on first dispatch and cached until the next
+    registration.
+
+    Synchronous handlers run inline first; asynchronous handlers then run
+    concurrently. A failing async handler is logged and does not prevent the
+    others from completing.
     """
 
     def __init__(self) -> None:
-        self._handlers: dict[type[DomainEvent], list[Callable]] = {}
+        self._handlers: dict[type[DomainEvent], list[tuple[bool, Callable]]] = {}
+        self._resolved: dict[type[DomainEvent], tuple[tuple[bool, Callable], ...]] = {}
 
     def register(self, event_type: type[DomainEvent], handler: Callable) -> None:
         """Register a handler for a specific event type.
@@ -28,20 +44,52 @@ class EventDispatcher(IEventDispatcher):
             event_type: The type of domain event to listen for.
             handler: A callable (sync or async) to invoke when the event is dispatched.
         """
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-        self._handlers[event_type].append(handler)
+        is_coro = inspect.iscoroutinefunction(handler)
+        self._handlers.setdefault(event_type, []).append((is_coro, handler))
+        self._resolved.clear()
+
+    def _resolve(self, event_type: type[DomainEvent]) -> tuple[tuple[bool, Callable], ...]:
+        """Collect and cache handlers for *event_type* and its base classes, most specific first.
+
+        Args:
+            event_type: The concrete type of the dispatched event.
+
+        Returns:
+            A tuple of ``(is_coro, handler)`` pairs.
+        """
+        handlers = tuple(entry for cls in event_type.__mro__ for entry in self._handlers.get(cls, ()))
+        self._resolved[event_type] = handlers
+        return handlers
 
     async def dispatch(self, event: DomainEvent) -> None:
-        """Dispatch a domain event to all registered handlers for its exact type.
+        """Dispatch a domain event to all handlers registered for its type or a base type.
 
         Args:
             event: The domain event to dispatch.
         """
         event_type = type(event)
-        handlers = self._handlers.get(event_type, [])
-        for handler in handlers:
-            if inspect.iscoroutinefunction(handler):
-                await handler(event)
-            else:
-                handler(event)
+        handlers = self._resolved.get(event_type)
+        if handlers is None:
+            handlers = self._resolve(event_type)
+        if not handlers:
+            return
+
+        for is_coro, handler in handlers:
+            if not is_coro:
+                try:
+                    handler(event)
+                except Exception:
+                    logger.exception(f"Event handler failed for {event_type.__name__}")
+
+        coros = [handler(event) for is_coro, handler in handlers if is_coro]
+        if len(coros) == 1:
+            # Awaiting directly avoids the task creation overhead of gather
+            try:
+                await coros[0]
+            except Exception:
+                logger.exception(f"Event handler failed for {event_type.__name__}")
+        elif coros:
+            results = await asyncio.gather(*coros, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Event handler failed for {event_type.__name__}", exc_info=result)
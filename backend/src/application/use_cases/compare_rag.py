@@ -1,6 +1,7 @@
 """CompareRAGUseCase - VectorRAGとGraphRAGの並列検索・結果比較ユースケース"""
 
 import asyncio
+from collections.abc import Awaitable
 from dataclasses import dataclass, field
 
 from src.application.interfaces import IEmbeddingService, ILLMService
@@ -8,7 +9,7 @@ from src.domain.models.query_result import QueryResult
 from src.domain.repositories import IGraphRepository, IVectorRepository
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ComparisonResult:
     """VectorRAGとGraphRAGの検索結果を集約した比較結果
 
@@ -27,6 +28,14 @@ class ComparisonResult:
     graph_error: str | None = None
 
 
+async def _capture_error(awaitable: Awaitable[list[QueryResult]]) -> list[QueryResult] | Exception:
+    """awaitableを待機し、発生した例外は送出せず戻り値として返す"""
+    try:
+        return await awaitable
+    except Exception as e:
+        return e
+
+
 class CompareRAGUseCase:
     """VectorRAGとGraphRAGの並列検索・結果集約ユースケース
 
@@ -64,32 +73,18 @@ class CompareRAGUseCase:
         query_embedding = embeddings[0]
 
         # Step 2: VectorRAG検索とGraphRAG検索を並列実行
-        vector_results: list[QueryResult] = []
-        graph_results: list[QueryResult] = []
-        vector_error: str | None = None
-        graph_error: str | None = None
-
-        async def search_vector() -> None:
-            nonlocal vector_results, vector_error
-            try:
-                vector_results = await self._vector_repo.search(query_embedding, top_k=top_k)
-            except Exception as e:
-                vector_error = str(e)
-
-        async def search_graph() -> None:
-            nonlocal graph_results, graph_error
-            try:
-                graph_results = await self._graph_repo.search(query)
-            except Exception as e:
-                graph_error = str(e)
-
-        await asyncio.gather(search_vector(), search_graph())
+        vector_outcome, graph_outcome = await asyncio.gather(
+            _capture_error(self._vector_repo.search(query_embedding, top_k=top_k)),
+            _capture_error(self._graph_repo.search(query)),
+        )
 
         # Step 3: 結果をComparisonResultに集約
+        vector_failed = isinstance(vector_outcome, Exception)
+        graph_failed = isinstance(graph_outcome, Exception)
         return ComparisonResult(
             query=query,
-            vector_results=vector_results,
-            graph_results=graph_results,
-            vector_error=vector_error,
-            graph_error=graph_error,
+            vector_results=[] if vector_failed else vector_outcome,
+            graph_results=[] if graph_failed else graph_outcome,
+            vector_error=str(vector_outcome) if vector_failed else None,
+            graph_error=str(graph_outcome) if graph_failed else None,
         )
@@ -4,6 +4,12 @@ Orchestrates the full document processing lifecycle:
 file parsing -> entity extraction -> embedding -> indexing -> event dispatch.
 """
 
+import asyncio
+import json
+import logging
+import os
+import re
+
 from src.application.interfaces import (
     IEmbeddingService,
     IEventDispatcher,
@@ -12,7 +18,7 @@ from src.application.interfaces import (
 )
 from src.domain.events import DocumentUploadedEvent
 from src.domain.models.document import Document
-from src.domain.models.graph_data import GraphData
+from src.domain.models.graph_data import Entity, GraphData, Relationship
 from src.domain.models.prompt import PromptType
 from src.domain.repositories import (
     IDocumentRepository,
@@ -21,6 +27,44 @@ from src.domain.repositories import (
     IVectorRepository,
 )
 
+logger = logging.getLogger(__name__)
+
+# Markdown headings (``# Title``) that are prepended to the chunks below them
+_HEADING_PATTERN = re.compile(r"^#{1,6}[ \t]+\S.*$", re.MULTILINE)
+
+# Preferred chunk break points, strongest first
+_BREAK_MARKERS = ("\n\n", "\n", "。", ". ")
+
+
+def _sliding_windows(text: str, size: int, overlap: int) -> list[str]:
+    """Cut *text* into windows of at most *size* characters sharing *overlap* characters.
+
+    Args:
+        text: The text to cut.
+        size: Maximum window length.
+        overlap: Number of characters shared by consecutive windows.
+
+    Returns:
+        A list of windows covering the whole text.
+    """
+    text_len = len(text)
+    windows: list[str] = []
+    start = 0
+    while start < text_len:
+        end = min(start + size, text_len)
+        if end < text_len:
+            min_end = start + size // 2
+            for marker in _BREAK_MARKERS:
+                pos = text.rfind(marker, min_end, end)
+                if pos != -1:
+                    end = pos + len(marker)
+                    break
+        windows.append(text[start:end])
+        if end >= text_len:
+            break
+        start = max(end - overlap, start + 1)
+    return windows
+
 
 class DocumentProcessorUseCase:
     """ドキュメント処理パイプライン: 受信 -> プロンプト取得 -> パース -> 保存
@@ -32,12 +76,29 @@ class DocumentProcessorUseCase:
     4. Load entity extraction prompt and render with text
     5. Send to LLM for entity extraction
     6. Mark as parsed (status: PARSED)
-    7. Create embeddings and store in VectorDB
-    8. Parse LLM response to GraphData and store in GraphDB
+    7. Create embeddings and parse LLM response to GraphData
+    8. Store embeddings in VectorDB and GraphData in GraphDB concurrently
     9. Mark as indexed (status: INDEXED)
     10. Dispatch DocumentUploadedEvent
+
+    The document is persisted only at durable state boundaries: once after
+    parsing (UPLOADED, for crash recovery and status visibility) and once at
+    the end as either INDEXED or FAILED. The intermediate PROCESSING and
+    PARSED states are not saved.
+
+    Embeddings are requested in batches of ``EMBED_BATCH_SIZE`` chunks with at
+    most ``MAX_CONCURRENT_BATCHES`` requests in flight, which bounds the size
+    of each request for large documents.
+
+    ``execute`` runs the whole pipeline inline. Callers that must not wait for
+    it (e.g. an upload endpoint) use ``enqueue`` instead, which saves the
+    document in UPLOADED state and returns immediately; the pipeline then runs
+    in ``run_worker`` via ``process_job``.
     """
 
+    EMBED_BATCH_SIZE = 64
+    MAX_CONCURRENT_BATCHES = 3
+
     def __init__(
         self,
         document_repo: IDocumentRepository,
@@ -57,6 +118,7 @@ class DocumentProcessorUseCase:
         self._llm_service = llm_service
         self._embedding_service = embedding_service
         self._file_parser = file_parser
+        self._queue: asyncio.Queue[tuple[Document, str]] = asyncio.Queue()
 
     async def execute(self, file_path: str) -> Document:
         """Execute the full document processing pipeline.
@@ -67,9 +129,50 @@ class DocumentProcessorUseCase:
         Returns:
             The processed Document entity with its final status.
         """
-        filename = file_path.split("/")[-1]
-        document = Document(filename=filename, content="")
+        document = Document(filename=os.path.basename(file_path), content="")
+        return await self.process_job(document, file_path)
+
+    async def enqueue(self, file_path: str) -> Document:
+        """Register a document and queue it for background processing.
+
+        Args:
+            file_path: Path to the file to process.
+
+        Returns:
+            The newly created Document entity in UPLOADED state.
+        """
+        document = Document(filename=os.path.basename(file_path), content="")
+        await self._document_repo.save(document)
+        await self._queue.put((document, file_path))
+        return document
 
+    async def run_worker(self) -> None:
+        """Process queued documents until cancelled.
+
+        Intended to be started as a background task, e.g.
+        ``asyncio.create_task(use_case.run_worker())``. A job that raises
+        (e.g. when persisting its FAILED state fails) is logged and skipped so
+        it cannot stop the worker.
+        """
+        while True:
+            document, file_path = await self._queue.get()
+            try:
+                await self.process_job(document, file_path)
+            except Exception:
+                logger.exception(f"Background job for document {document.id} failed")
+            finally:
+                self._queue.task_done()
+
+    async def process_job(self, document: Document, file_path: str) -> Document:
+        """Run the processing pipeline for an already created document.
+
+        Args:
+            document: The Document entity in UPLOADED state.
+            file_path: Path to the file to process.
+
+        Returns:
+            The processed Document entity with its final status.
+        """
         try:
             # Step 1: Parse file to extract raw text
             raw_text = await self._file_parser.parse(file_path)
@@ -78,7 +181,6 @@ class DocumentProcessorUseCase:
 
             # Step 2: Start processing
             document.start_processing()
-            await self._document_repo.save(document)
 
             # Step 3: Load prompt and generate with LLM
             prompt_template = self._prompt_repo.load(PromptType.ENTITY_EXTRACTION)
@@ -87,16 +189,23 @@ class DocumentProcessorUseCase:
 
             # Step 4: Mark as parsed
             document.mark_parsed(llm_response)
-            await self._document_repo.save(document)
 
-            # Step 5: Create embeddings and store in VectorDB
+            # Step 5: Create embeddings and parse LLM response to graph data
             chunks = self._split_text(raw_text)
-            embeddings = await self._embedding_service.create_embeddings(chunks)
-            await self._vector_repo.store_embeddings(document.id, chunks, embeddings)
+            embeddings = await self._create_embeddings(chunks)
+            graph_data = await self._parse_graph_data(llm_response)
 
-            # Step 6: Parse LLM response to graph data and store in GraphDB
-            graph_data = self._parse_graph_data(llm_response)
-            await self._graph_repo.store_graph(document.id, graph_data)
+            # Step 6: Store in VectorDB and GraphDB concurrently. Both writes
+            # are awaited before a failure is raised, so neither can land after
+            # the document has been saved as FAILED.
+            results = await asyncio.gather(
+                self._vector_repo.store_embeddings(document.id, chunks, embeddings),
+                self._graph_repo.store_graph(document.id, graph_data),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
 
             # Step 7: Mark as indexed
             document.mark_indexed()
@@ -115,28 +224,82 @@ class DocumentProcessorUseCase:
 
         return document
 
-    def _split_text(self, text: str, chunk_size: int = 500) -> list[str]:
-        """Split text into chunks for embedding.
+    def _split_text(self, text: str, chunk_size: int = 500, overlap: int = 100) -> list[str]:
+        """Split text into overlapping, section-aware chunks for embedding.
+
+        The text is first divided into sections at markdown headings, so a
+        chunk never spans two sections. Each section body is then cut into
+        sliding windows of at most *chunk_size* characters that overlap by
+        *overlap* characters. Where possible a window ends on a paragraph,
+        line or sentence boundary in its second half instead of mid-sentence.
+        The section heading is prepended to every chunk of that section. A
+        heading with no body of its own is carried into the next section's
+        heading, or emitted as its own chunk if no body follows it.
 
         Args:
             text: The raw text to split.
-            chunk_size: Maximum number of characters per chunk.
+            chunk_size: Maximum number of body characters per chunk.
+            overlap: Number of characters shared by consecutive chunks.
+                Clamped to less than *chunk_size*.
 
         Returns:
             A list of text chunks.
         """
-        if not text:
-            return []
-        chunks = []
-        for i in range(0, len(text), chunk_size):
-            chunks.append(text[i : i + chunk_size])
+        overlap = max(0, min(overlap, chunk_size - 1))
+        chunks: list[str] = []
+        heading = ""
+        # True while *heading* has not yet been written into any chunk
+        heading_pending = False
+        section_start = 0
+        for match in [*_HEADING_PATTERN.finditer(text), None]:
+            section_end = match.start() if match else len(text)
+            body = text[section_start:section_end]
+            if body.strip():
+                for window in _sliding_windows(body, chunk_size, overlap):
+                    chunks.append(f"{heading}\n{window}" if heading else window)
+                heading_pending = False
+            if match:
+                heading = f"{heading}\n{match.group()}" if heading_pending else match.group()
+                heading_pending = True
+                section_start = match.end() + 1
+            elif heading_pending:
+                chunks.append(heading)
         return chunks
 
-    def _parse_graph_data(self, llm_response: str) -> GraphData:
-        """Parse LLM response into GraphData.
+    async def _create_embeddings(self, chunks: list[str]) -> list[list[float]]:
+        """Create embeddings for chunks in bounded, concurrent batches.
+
+        If a batch fails, the remaining batches are cancelled and awaited
+        before the error is raised, so no request outlives the call.
+
+        Args:
+            chunks: The text chunks to embed.
+
+        Returns:
+            One embedding per chunk, in the same order as *chunks*.
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_BATCHES)
+
+        async def embed_batch(batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                return await self._embedding_service.create_embeddings(batch)
+
+        size = self.EMBED_BATCH_SIZE
+        tasks = [asyncio.create_task(embed_batch(chunks[i : i + size])) for i in range(0, len(chunks), size)]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return [embedding for batch in results for embedding in batch]
+
+    async def _parse_graph_data(self, llm_response: str) -> GraphData:
+        """Parse LLM response into GraphData without blocking the event loop.
 
-        For now, returns empty GraphData.
-        Full JSON parsing will be implemented in the Infrastructure layer.
+        JSON decoding of large responses is CPU-bound, so it runs in a worker
+        thread to keep concurrent searches responsive.
 
         Args:
             llm_response: The raw LLM response string.
@@ -144,4 +307,62 @@ class DocumentProcessorUseCase:
         Returns:
             A GraphData value object.
         """
-        return GraphData()
+        return await asyncio.to_thread(self._parse_graph_data_sync, llm_response)
+
+    @staticmethod
+    def _parse_graph_data_sync(llm_response: str) -> GraphData:
+        """Decode the entity extraction JSON in *llm_response* into GraphData.
+
+        The JSON object may be surrounded by other text such as markdown code
+        fences. Items missing required keys are skipped, ``entities`` or
+        ``relationships`` values that are not lists are treated as empty, and a
+        response without a decodable JSON object yields an empty GraphData.
+
+        Args:
+            llm_response: The raw LLM response string.
+
+        Returns:
+            A GraphData value object.
+        """
+        start = llm_response.find("{")
+        end = llm_response.rfind("}")
+        if start == -1 or end < start:
+            logger.warning("LLM response contains no JSON object")
+            return GraphData()
+        try:
+            data = json.loads(llm_response[start : end + 1])
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to decode LLM response as JSON: {e}")
+            return GraphData()
+        if not isinstance(data, dict):
+            return GraphData()
+
+        raw_entities = data.get("entities") or []
+        if not isinstance(raw_entities, list):
+            logger.warning(f"Ignoring non-list 'entities' in LLM response: {type(raw_entities).__name__}")
+            raw_entities = []
+        raw_relationships = data.get("relationships") or []
+        if not isinstance(raw_relationships, list):
+            logger.warning(f"Ignoring non-list 'relationships' in LLM response: {type(raw_relationships).__name__}")
+            raw_relationships = []
+
+        entities = tuple(
+            Entity(
+                name=str(item["name"]),
+                type=str(item.get("type", "")),
+                description=str(item.get("description", "")),
+            )
+            for item in raw_entities
+            if isinstance(item, dict) and item.get("name")
+        )
+        relationships = tuple(
+            Relationship(
+                source=str(item["source"]),
+                target=str(item["target"]),
+                relation_type=str(item.get("relation_type", "")),
+                description=str(item.get("description", "")),
+            )
+            for item in raw_relationships
+            if isinstance(item, dict) and item.get("source") and item.get("target")
+        )
+        return GraphData(entities=entities, relationships=relationships)
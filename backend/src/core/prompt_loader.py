@@ -6,24 +6,49 @@ Provides a single entry-point for loading prompt templates by
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 import yaml
 from src.domain.models.prompt import PromptTemplate, PromptType
 
+try:
+    # libyaml-backed loader; much faster than the pure-Python SafeLoader
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 
 class PromptLoader:
     """Load :class:`PromptTemplate` instances from YAML files.
 
+    Loaded templates are immutable, so each one is cached per
+    :class:`PromptType` and the YAML file is only read on first access.
+    Parsed YAML is additionally memoised per file path and modification
+    time, so several loaders pointing at the same directory parse each file
+    once, while a loader created after a file was edited sees the new content.
+
     Args:
         prompts_dir: Directory containing ``<prompt_type>.yaml`` files.
             Defaults to the ``prompts/`` directory next to this module.
+        source: Optional callable returning the YAML text for a prompt type.
+            When given, it is used instead of reading from *prompts_dir*
+            (e.g. to load prompts from memory in tests).
     """
 
-    def __init__(self, prompts_dir: Path | None = None) -> None:
+    def __init__(
+        self,
+        prompts_dir: Path | None = None,
+        *,
+        source: Callable[[PromptType], str] | None = None,
+    ) -> None:
         if prompts_dir is None:
             prompts_dir = Path(__file__).parent / "prompts"
         self._prompts_dir = prompts_dir
+        self._source = source
+        self._cache: dict[PromptType, PromptTemplate] = {}
 
     def load(self, prompt_type: PromptType) -> PromptTemplate:
         """Load a prompt template for the given *prompt_type*.
@@ -38,24 +63,46 @@ class PromptLoader:
             FileNotFoundError: If the YAML file does not exist.
             ValueError: If the YAML is malformed or missing required fields.
         """
-        file_path = self._prompts_dir / f"{prompt_type.value}.yaml"
-        if not file_path.exists():
-            raise FileNotFoundError(f"Prompt file not found: {file_path}")
-
-        with open(file_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        cached = self._cache.get(prompt_type)
+        if cached is not None:
+            return cached
+
+        origin: Path | str
+        if self._source is not None:
+            origin = f"<source:{prompt_type.value}>"
+            data = yaml.load(self._source(prompt_type), Loader=_SafeLoader)
+        else:
+            origin = self._prompts_dir / f"{prompt_type.value}.yaml"
+            try:
+                mtime_ns = origin.stat().st_mtime_ns
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Prompt file not found: {origin}") from None
+            data = self._load_yaml(origin, mtime_ns)
 
         if not isinstance(data, dict):
-            raise ValueError(f"Invalid YAML format in {file_path}")
+            raise ValueError(f"Invalid YAML format in {origin}")
 
         required_fields = ["name", "template", "version"]
         for field_name in required_fields:
             if field_name not in data:
-                raise ValueError(f"Missing required field '{field_name}' in {file_path}")
+                raise ValueError(f"Missing required field '{field_name}' in {origin}")
 
-        return PromptTemplate(
+        template = PromptTemplate(
             name=data["name"],
             template=data["template"],
             version=data["version"],
-            variables=data.get("variables", []),
+            variables=tuple(data.get("variables", ())),
         )
+        self._cache[prompt_type] = template
+        return template
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _load_yaml(path: Path, mtime_ns: int) -> Any:
+        """Parse the YAML file at *path*, memoised by path and *mtime_ns*.
+
+        *mtime_ns* is only part of the cache key: an edited file has a new
+        modification time and is therefore parsed again.
+        """
+        with open(path, encoding="utf-8") as f:
+            return yaml.load(f, Loader=_SafeLoader)
@@ -1,10 +1,10 @@
 """Domain events for the Local RAG Comparator system."""
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DomainEvent:
     """Base class for all domain events.
 
@@ -12,10 +12,10 @@ class DomainEvent:
         occurred_at: Timestamp when the event occurred. Auto-set to current time if not provided.
     """
 
-    occurred_at: datetime = field(default_factory=datetime.utcnow)
+    occurred_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DocumentUploadedEvent(DomainEvent):
     """Event raised when a document is successfully uploaded.
 
@@ -29,7 +29,7 @@ class DocumentUploadedEvent(DomainEvent):
     filename: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileDetectedEvent(DomainEvent):
     """Event raised when a new file is detected in the watched directory.
 
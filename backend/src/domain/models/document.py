@@ -2,7 +2,7 @@
 
 import uuid
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
 
 
@@ -32,7 +32,23 @@ _VALID_TRANSITIONS: dict[DocumentStatus, set[DocumentStatus]] = {
 }
 
 
-@dataclass
+def _encode_transitions() -> None:
+    """Store the transition table as integer bitmasks on each DocumentStatus.
+
+    Each status gets a ``_bit`` and an ``_allowed_mask`` of the statuses it may
+    transition to, so a transition check is a single AND instead of dict and
+    set lookups.
+    """
+    for index, status in enumerate(DocumentStatus):
+        status._bit = 1 << index
+    for status, targets in _VALID_TRANSITIONS.items():
+        status._allowed_mask = sum(target._bit for target in targets)
+
+
+_encode_transitions()
+
+
+@dataclass(slots=True)
 class Document:
     """Document entity representing a file uploaded for RAG processing.
 
@@ -44,10 +60,10 @@ class Document:
 
     filename: str
     content: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
     status: DocumentStatus = DocumentStatus.UPLOADED
     metadata: dict = field(default_factory=dict)
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     parsed_content: str | None = None
     error: str | None = None
 
@@ -64,7 +80,7 @@ class Document:
         Raises:
             InvalidStateTransitionError: If the transition is not allowed.
         """
-        if new_status not in _VALID_TRANSITIONS.get(self.status, set()):
+        if not self.status._allowed_mask & new_status._bit:
             raise InvalidStateTransitionError(f"Cannot transition from {self.status.value} to {new_status.value}")
         self.status = new_status
 
@@ -94,7 +110,5 @@ class Document:
         Raises:
             InvalidStateTransitionError: If already in FAILED state.
         """
-        if self.status == DocumentStatus.FAILED:
-            raise InvalidStateTransitionError(f"Cannot transition from {self.status.value} to failed")
-        self.status = DocumentStatus.FAILED
+        self._transition_to(DocumentStatus.FAILED)
         self.error = error
@@ -3,7 +3,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Entity:
     """Immutable value object representing a knowledge graph entity (node).
 
@@ -18,7 +18,7 @@ class Entity:
     description: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Relationship:
     """Immutable value object representing a knowledge graph relationship (edge).
 
@@ -35,8 +35,18 @@ class Relationship:
     description: str
 
 
-@dataclass(frozen=True)
-class GraphData:
+class _GraphDataIndex:
+    """Slot holding GraphData's lazily built name index.
+
+    Declared on a base class so the index is not a dataclass field and stays
+    out of ``fields()``, ``asdict()`` and serialised responses.
+    """
+
+    __slots__ = ("_by_name",)
+
+
+@dataclass(frozen=True, slots=True)
+class GraphData(_GraphDataIndex):
     """Immutable value object representing a knowledge graph with entities and relationships.
 
     Attributes:
@@ -66,7 +76,11 @@ class GraphData:
         Returns:
             The matching Entity, or None if not found.
         """
-        for entity in self.entities:
-            if entity.name == name:
-                return entity
-        return None
+        try:
+            by_name = self._by_name
+        except AttributeError:
+            # Built on first lookup (and again after copy/pickle, which only
+            # carry fields); reversed so the first entity with a name wins.
+            by_name = {e.name: e for e in reversed(self.entities)}
+            object.__setattr__(self, "_by_name", by_name)
+        return by_name.get(name)
@@ -6,10 +6,54 @@ the RAG comparison pipeline.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import re
+from dataclasses import dataclass, fields
 from enum import Enum
 from typing import Any
 
+# Matches ``{{variable}}`` placeholders, tolerating inner whitespace such as
+# ``{{ variable }}``; group 1 is the variable name.
+_VARIABLE_PATTERN = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
+def _compile_template(template: str) -> str:
+    """Translate ``{{variable}}`` placeholders into a :meth:`str.format_map` string.
+
+    Each placeholder keeps its inner text, including any padding, as the
+    field name (``{{ name }}`` becomes ``{ name }``), so an unknown placeholder
+    can be restored exactly. Literal braces are escaped, and all-digit names
+    are kept as literal text because ``str.format`` would treat them as
+    positional fields.
+    """
+    parts: list[str] = []
+    pos = 0
+    for match in _VARIABLE_PATTERN.finditer(template):
+        name = match.group(1)
+        parts.append(template[pos : match.start()].replace("{", "{{").replace("}", "}}"))
+        if name.isdigit():
+            parts.append(match.group(0).replace("{", "{{").replace("}", "}}"))
+        else:
+            parts.append("{" + match.group(0)[2:-2] + "}")
+        pos = match.end()
+    parts.append(template[pos:].replace("{", "{{").replace("}", "}}"))
+    return "".join(parts)
+
+
+class _Substitutions(dict):
+    """Mapping for :meth:`str.format_map` that leaves unknown placeholders as-is.
+
+    Padded field names such as ``" name "`` resolve to the stripped variable;
+    anything still unknown is rebuilt verbatim from the field name.
+    """
+
+    __slots__ = ()
+
+    def __missing__(self, key: str) -> str:
+        name = key.strip()
+        if name != key and name in self:
+            return self[name]
+        return "{{" + key + "}}"
+
 
 class PromptType(Enum):
     """Supported prompt categories for the RAG pipeline."""
@@ -19,31 +63,56 @@ class PromptType(Enum):
     SUMMARIZATION = "summarization"
 
 
-@dataclass(frozen=True)
-class PromptTemplate:
+class _PromptTemplateCache:
+    """Slots holding values PromptTemplate derives from its fields.
+
+    Declared on a base class so they are not dataclass fields and stay out of
+    ``fields()``, ``asdict()`` and serialised responses.
+    """
+
+    __slots__ = ("_variable_set", "_compiled")
+
+
+@dataclass(frozen=True, slots=True)
+class PromptTemplate(_PromptTemplateCache):
     """Immutable value object representing a prompt template.
 
     Attributes:
         name: Human-readable identifier for the prompt.
         template: The template string with ``{{variable}}`` placeholders.
         version: Semantic version of the prompt template.
-        variables: List of variable names expected by the template.
+        variables: Variable names expected by the template.
     """
 
     name: str
     template: str
     version: str
-    variables: list[str] = field(default_factory=list)
+    variables: tuple[str, ...] = ()
 
     def __post_init__(self) -> None:
         if not self.name:
             raise ValueError("Prompt name cannot be empty")
         if not self.template:
             raise ValueError("Prompt template cannot be empty")
+        self._init_cache()
+
+    def _init_cache(self) -> None:
+        object.__setattr__(self, "_variable_set", frozenset(self.variables))
+        object.__setattr__(self, "_compiled", _compile_template(self.template))
+
+    def __setstate__(self, state: Any) -> None:
+        # copy/pickle restore only the fields; rebuild the derived values
+        for name, value in zip((f.name for f in fields(self)), state, strict=True):
+            object.__setattr__(self, name, value)
+        self._init_cache()
 
     def render(self, **kwargs: Any) -> str:
         """Render the template by substituting ``{{variable}}`` placeholders.
 
+        The template is translated to a :meth:`str.format_map` string once at
+        construction, so each call is a single C-level formatting pass.
+        Placeholders without a matching keyword argument are left untouched.
+
         Args:
             **kwargs: Variable name/value pairs to substitute.
 
@@ -53,10 +122,7 @@ class PromptTemplate:
         Raises:
             ValueError: If any declared variable is not provided in *kwargs*.
         """
-        missing = [v for v in self.variables if v not in kwargs]
-        if missing:
+        if not self._variable_set.issubset(kwargs):
+            missing = [v for v in self.variables if v not in kwargs]
             raise ValueError(f"Missing required variables: {missing}")
-        result = self.template
-        for key, value in kwargs.items():
-            result = result.replace(f"{{{{{key}}}}}", str(value))
-        return result
+        return self._compiled.format_map(_Substitutions({key: str(value) for key, value in kwargs.items()}))
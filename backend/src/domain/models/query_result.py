@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QueryResult:
     """Immutable value object representing a RAG query result.
 
@@ -26,3 +26,21 @@ class QueryResult:
             raise ValueError(f"rag_type must be 'vector' or 'graph', got '{self.rag_type}'")
         if not (0.0 <= self.score <= 1.0):
             raise ValueError(f"score must be between 0.0 and 1.0, got {self.score}")
+
+    @classmethod
+    def unchecked(cls, query: str, answer: str, sources: tuple[str, ...], score: float, rag_type: str) -> "QueryResult":
+        """Create a QueryResult without running validation.
+
+        Only for trusted internal construction (e.g. repositories) where
+        *rag_type* and *score* are already known to be valid.
+
+        Returns:
+            A new QueryResult instance.
+        """
+        obj = cls.__new__(cls)
+        object.__setattr__(obj, "query", query)
+        object.__setattr__(obj, "answer", answer)
+        object.__setattr__(obj, "sources", sources)
+        object.__setattr__(obj, "score", score)
+        object.__setattr__(obj, "rag_type", rag_type)
+        return obj
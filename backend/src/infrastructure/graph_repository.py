@@ -136,7 +136,7 @@ class GraphRAGRepository(IGraphRepository):
                 if query_lower in name_lower or query_lower in desc_lower:
                     score = 1.0 if query_lower in name_lower else 0.7
                     results.append(
-                        QueryResult(
+                        QueryResult.unchecked(
                             query=query,
                             answer=f"{row['name']} ({row['type']}): {row['description']}",
                             sources=(document_id,),
@@ -47,7 +47,7 @@ class ChromaDBVectorRepository(IVectorRepository):
                 document_id = metadata.get("document_id", "unknown")
 
                 query_results.append(
-                    QueryResult(
+                    QueryResult.unchecked(
                         query="",
                         answer=doc,
                         sources=(document_id,),
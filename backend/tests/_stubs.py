@@ -0,0 +1,78 @@
+"""Lightweight hand-written test doubles.
+
+``AsyncMock`` builds child mocks and records calls reflectively on every
+attribute access. For dependencies whose interface is a handful of async
+methods, these plain stubs provide the small subset of the mock API the
+tests rely on at a fraction of the cost.
+"""
+
+from __future__ import annotations
+
+import inspect
+from types import SimpleNamespace
+from typing import Any
+
+
+class AsyncStub:
+    """Awaitable callable that records calls and returns a configurable value.
+
+    Attributes:
+        calls: ``(args, kwargs)`` tuples for every call, in order.
+        return_value: Value returned by each call.
+        side_effect: Exception (instance or class) to raise, or a callable
+            whose result is returned instead of *return_value*. As with
+            ``AsyncMock``, an awaitable result (e.g. from an ``async def``
+            side effect) is awaited first.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+        self.return_value: Any = None
+        self.side_effect: Any = None
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        side_effect = self.side_effect
+        if side_effect is not None:
+            if isinstance(side_effect, BaseException) or (
+                isinstance(side_effect, type) and issubclass(side_effect, BaseException)
+            ):
+                raise side_effect
+            result = side_effect(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        return self.return_value
+
+    @property
+    def called(self) -> bool:
+        return bool(self.calls)
+
+    @property
+    def call_count(self) -> int:
+        return len(self.calls)
+
+    @property
+    def call_args(self) -> tuple[tuple[Any, ...], dict[str, Any]] | None:
+        return self.calls[-1] if self.calls else None
+
+    def assert_called_once_with(self, *args: Any, **kwargs: Any) -> None:
+        assert self.calls == [(args, kwargs)], f"Expected one call with {(args, kwargs)}, got {self.calls}"
+
+    def assert_not_called(self) -> None:
+        assert not self.calls, f"Expected no calls, got {self.calls}"
+
+    def reset_mock(self, return_value: bool = False, side_effect: bool = False) -> None:
+        self.calls.clear()
+        if return_value:
+            self.return_value = None
+        if side_effect:
+            self.side_effect = None
+
+
+class StubNamespace(SimpleNamespace):
+    """Namespace of :class:`AsyncStub` methods standing in for a dependency."""
+
+    def reset_mock(self, return_value: bool = False, side_effect: bool = False) -> None:
+        for stub in vars(self).values():
+            stub.reset_mock(return_value=return_value, side_effect=side_effect)
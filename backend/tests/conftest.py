@@ -0,0 +1,15 @@
+"""Shared test configuration.
+
+Pre-import the application and domain modules used across the suite so that
+each (xdist) worker pays their import cost once at startup instead of inside
+the first test that touches them.
+"""
+
+import src.application.event_dispatcher  # noqa: F401
+import src.application.use_cases.compare_rag  # noqa: F401
+import src.application.use_cases.document_processor  # noqa: F401
+import src.domain.events  # noqa: F401
+import src.domain.models.document  # noqa: F401
+import src.domain.models.graph_data  # noqa: F401
+import src.domain.models.prompt  # noqa: F401
+import src.domain.models.query_result  # noqa: F401
@@ -1,5 +1,6 @@
 """Tests for DocumentProcessorUseCase - document processing pipeline."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -10,9 +11,9 @@ from src.domain.models.graph_data import GraphData
 from src.domain.models.prompt import PromptTemplate, PromptType
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_dependencies():
-    """Create all mocked dependencies for DocumentProcessorUseCase."""
+    """Create all mocked dependencies for DocumentProcessorUseCase once per module."""
     return {
         "document_repo": AsyncMock(),
         "prompt_repo": MagicMock(),
@@ -25,26 +26,53 @@ def mock_dependencies():
     }
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_dependencies):
+    """Record saved documents, then clear the shared mocks after each test.
+
+    document_repo.save appends each saved document to ``document_repo._saved``
+    and snapshots its status into ``save._statuses``, because Document is
+    mutable and call_args_list only keeps references to it. Reading these
+    plain lists also avoids walking mock call records in assertions.
+    """
+    document_repo = mock_dependencies["document_repo"]
+    save = document_repo.save
+    document_repo._saved = []
+    save._statuses = []
+
+    def record(document: Document) -> None:
+        document_repo._saved.append(document)
+        save._statuses.append(document.status)
+
+    save.side_effect = record
+    yield
+    for mock in mock_dependencies.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="module")
 def prompt_template():
     """Create a test PromptTemplate for entity extraction."""
     return PromptTemplate(
         name="entity_extraction",
         template="Extract entities from: {{text}} in {{language}}",
         version="1.0",
-        variables=["text", "language"],
+        variables=("text", "language"),
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def use_case(mock_dependencies):
-    """Create a DocumentProcessorUseCase with mocked dependencies."""
+    """Create a DocumentProcessorUseCase with mocked dependencies once per module."""
     return DocumentProcessorUseCase(**mock_dependencies)
 
 
 @pytest.fixture
 def configured_mocks(mock_dependencies, prompt_template):
-    """Set up mock return values for the happy path."""
+    """Set up mock return values for the happy path.
+
+    Function-scoped because the return values are cleared after every test.
+    """
     mock_dependencies["file_parser"].parse.return_value = "This is the raw text content of the document."
     mock_dependencies["prompt_repo"].load.return_value = prompt_template
     mock_dependencies[
@@ -55,15 +83,14 @@ def configured_mocks(mock_dependencies, prompt_template):
 
 
 @pytest.fixture
-def configured_use_case(configured_mocks):
-    """Create a DocumentProcessorUseCase with fully configured mocks."""
-    return DocumentProcessorUseCase(**configured_mocks)
+def configured_use_case(use_case, configured_mocks):
+    """Return the shared DocumentProcessorUseCase with fully configured mocks."""
+    return use_case
 
 
 class TestDocumentProcessorExecuteSuccess:
     """Tests for the happy path of the document processing pipeline."""
 
-    @pytest.mark.asyncio
     async def test_execute_success_full_pipeline(self, configured_use_case, configured_mocks):
         """Test the full happy path: parse -> process -> embed -> index -> dispatch event."""
         result = await configured_use_case.execute("/path/to/test_doc.pdf")
@@ -89,29 +116,26 @@ class TestDocumentProcessorExecuteSuccess:
         configured_mocks["vector_repo"].store_embeddings.assert_called_once()
         configured_mocks["graph_repo"].store_graph.assert_called_once()
 
-        # Verify document_repo.save was called multiple times (status transitions)
-        assert configured_mocks["document_repo"].save.call_count >= 3
+        # Verify document_repo.save was called for the initial and final states only
+        assert configured_mocks["document_repo"].save.call_count == 2
 
         # Verify event was dispatched
         configured_mocks["event_dispatcher"].dispatch.assert_called_once()
         dispatched_event = configured_mocks["event_dispatcher"].dispatch.call_args[0][0]
         assert isinstance(dispatched_event, DocumentUploadedEvent)
 
-    @pytest.mark.asyncio
     async def test_execute_calls_file_parser_with_correct_path(self, configured_use_case, configured_mocks):
         """Verify file_parser.parse is called with the provided file path."""
         await configured_use_case.execute("/data/uploads/report.pdf")
 
         configured_mocks["file_parser"].parse.assert_called_once_with("/data/uploads/report.pdf")
 
-    @pytest.mark.asyncio
     async def test_execute_loads_entity_extraction_prompt(self, configured_use_case, configured_mocks):
         """Verify prompt_repo.load is called with PromptType.ENTITY_EXTRACTION."""
         await configured_use_case.execute("/path/to/doc.pdf")
 
         configured_mocks["prompt_repo"].load.assert_called_once_with(PromptType.ENTITY_EXTRACTION)
 
-    @pytest.mark.asyncio
     async def test_execute_renders_prompt_with_parsed_text(self, configured_use_case, configured_mocks):
         """Verify the LLM receives a rendered prompt containing the file's text content."""
         raw_text = "This is the raw text content of the document."
@@ -122,7 +146,6 @@ class TestDocumentProcessorExecuteSuccess:
         llm_call_args = configured_mocks["llm_service"].generate.call_args[0][0]
         assert raw_text in llm_call_args
 
-    @pytest.mark.asyncio
     async def test_execute_creates_embeddings_from_text_chunks(self, configured_use_case, configured_mocks):
         """Verify embedding_service is called with text chunks derived from the raw text."""
         await configured_use_case.execute("/path/to/doc.pdf")
@@ -133,7 +156,50 @@ class TestDocumentProcessorExecuteSuccess:
         assert len(call_args) > 0
         assert all(isinstance(chunk, str) for chunk in call_args)
 
-    @pytest.mark.asyncio
+    async def test_execute_creates_embeddings_in_batches(self, configured_use_case, configured_mocks, monkeypatch):
+        """Verify large chunk lists are embedded in ordered batches of EMBED_BATCH_SIZE."""
+        batch_size = DocumentProcessorUseCase.EMBED_BATCH_SIZE
+        chunks = [f"chunk {i}" for i in range(batch_size * 2 + 1)]
+        monkeypatch.setattr(configured_use_case, "_split_text", MagicMock(return_value=chunks))
+
+        async def create_embeddings(texts: list[str]) -> list[list[float]]:
+            return [[float(text.split()[1])] for text in texts]
+
+        configured_mocks["embedding_service"].create_embeddings.side_effect = create_embeddings
+
+        await configured_use_case.execute("/path/to/doc.pdf")
+
+        batch_sizes = [len(c[0][0]) for c in configured_mocks["embedding_service"].create_embeddings.call_args_list]
+        assert batch_sizes == [batch_size, batch_size, 1]
+        embeddings = configured_mocks["vector_repo"].store_embeddings.call_args[0][2]
+        assert embeddings == [[float(i)] for i in range(len(chunks))]
+
+    async def test_execute_cancels_remaining_batches_on_failure(
+        self, configured_use_case, configured_mocks, monkeypatch
+    ):
+        """A failed embedding batch must stop the other batches from calling the service."""
+        monkeypatch.setattr(configured_use_case, "_split_text", MagicMock(return_value=["a", "b", "c"]))
+        monkeypatch.setattr(configured_use_case, "EMBED_BATCH_SIZE", 1)
+        cancelled: list[str] = []
+
+        async def create_embeddings(texts: list[str]) -> list[list[float]]:
+            if texts == ["a"]:
+                raise RuntimeError("embedding failed")
+            try:
+                await asyncio.sleep(1.0)
+            except asyncio.CancelledError:
+                cancelled.extend(texts)
+                raise
+            return [[0.0]]
+
+        configured_mocks["embedding_service"].create_embeddings.side_effect = create_embeddings
+
+        result = await configured_use_case.execute("/path/to/doc.pdf")
+
+        assert result.status == DocumentStatus.FAILED
+        assert sorted(cancelled) == ["b", "c"]
+        configured_mocks["vector_repo"].store_embeddings.assert_not_called()
+
     async def test_execute_stores_in_vector_and_graph_repos(self, configured_use_case, configured_mocks):
         """Verify both vector_repo.store_embeddings and graph_repo.store_graph are called."""
         result = await configured_use_case.execute("/path/to/doc.pdf")
@@ -151,7 +217,43 @@ class TestDocumentProcessorExecuteSuccess:
         assert graph_call_args[0][0] == result.id  # document_id
         assert isinstance(graph_call_args[0][1], GraphData)  # graph_data
 
-    @pytest.mark.asyncio
+    async def test_execute_stores_vector_and_graph_concurrently(self, configured_use_case, configured_mocks):
+        """Verify vector and graph writes overlap instead of running one after another."""
+        graph_started = asyncio.Event()
+
+        async def store_embeddings(*args) -> None:
+            await asyncio.wait_for(graph_started.wait(), timeout=1.0)
+
+        async def store_graph(*args) -> None:
+            graph_started.set()
+
+        configured_mocks["vector_repo"].store_embeddings.side_effect = store_embeddings
+        configured_mocks["graph_repo"].store_graph.side_effect = store_graph
+
+        result = await configured_use_case.execute("/path/to/doc.pdf")
+
+        assert result.status == DocumentStatus.INDEXED
+
+    async def test_execute_waits_for_both_stores_before_failing(self, configured_use_case, configured_mocks):
+        """A failing vector write must not leave the graph write running after the FAILED save."""
+        graph_finished = asyncio.Event()
+
+        async def store_embeddings(*args) -> None:
+            raise RuntimeError("vector db down")
+
+        async def store_graph(*args) -> None:
+            await asyncio.sleep(0.01)
+            graph_finished.set()
+
+        configured_mocks["vector_repo"].store_embeddings.side_effect = store_embeddings
+        configured_mocks["graph_repo"].store_graph.side_effect = store_graph
+
+        result = await configured_use_case.execute("/path/to/doc.pdf")
+
+        assert result.status == DocumentStatus.FAILED
+        assert result.error == "vector db down"
+        assert graph_finished.is_set()
+
     async def test_execute_dispatches_document_uploaded_event(self, configured_use_case, configured_mocks):
         """Verify event_dispatcher.dispatch is called with a DocumentUploadedEvent."""
         result = await configured_use_case.execute("/path/to/my_file.pdf")
@@ -166,70 +268,34 @@ class TestDocumentProcessorExecuteSuccess:
 class TestDocumentProcessorStatusTransitions:
     """Tests for document status transitions during processing."""
 
-    @pytest.mark.asyncio
-    async def test_execute_document_status_transitions(self, configured_mocks, prompt_template):
-        """Verify Document goes through UPLOADED -> PROCESSING -> PARSED -> INDEXED."""
-        # Capture the document status at each save call using side_effect,
-        # because Document is mutable and call_args_list stores references.
-        captured_statuses: list[DocumentStatus] = []
-
-        async def capture_status(document: Document) -> None:
-            captured_statuses.append(document.status)
-
-        configured_mocks["document_repo"].save.side_effect = capture_status
-
-        use_case = DocumentProcessorUseCase(**configured_mocks)
-        result = await use_case.execute("/path/to/doc.pdf")
-
-        # Should see the progression: UPLOADED, PROCESSING, PARSED, INDEXED
-        assert DocumentStatus.UPLOADED in captured_statuses
-        assert DocumentStatus.PROCESSING in captured_statuses
-        assert DocumentStatus.PARSED in captured_statuses
-        assert DocumentStatus.INDEXED in captured_statuses
+    async def test_execute_document_status_transitions(self, configured_use_case, configured_mocks):
+        """Verify the persisted statuses go from UPLOADED to INDEXED."""
+        result = await configured_use_case.execute("/path/to/doc.pdf")
 
-        # Verify correct ordering
-        uploaded_idx = captured_statuses.index(DocumentStatus.UPLOADED)
-        processing_idx = captured_statuses.index(DocumentStatus.PROCESSING)
-        parsed_idx = captured_statuses.index(DocumentStatus.PARSED)
-        indexed_idx = captured_statuses.index(DocumentStatus.INDEXED)
-        assert uploaded_idx < processing_idx < parsed_idx < indexed_idx
+        assert configured_mocks["document_repo"].save._statuses == [DocumentStatus.UPLOADED, DocumentStatus.INDEXED]
 
         # Final result should be INDEXED
         assert result.status == DocumentStatus.INDEXED
 
-    @pytest.mark.asyncio
-    async def test_execute_saves_document_at_each_status_change(self, configured_mocks, prompt_template):
-        """Verify document_repo.save is called at each status transition."""
-        captured_statuses: list[DocumentStatus] = []
-
-        async def capture_status(document: Document) -> None:
-            captured_statuses.append(document.status)
-
-        configured_mocks["document_repo"].save.side_effect = capture_status
-
-        use_case = DocumentProcessorUseCase(**configured_mocks)
-        await use_case.execute("/path/to/doc.pdf")
+    async def test_execute_saves_document_only_at_durable_states(self, configured_use_case, configured_mocks):
+        """Verify intermediate PROCESSING and PARSED states are not persisted."""
+        await configured_use_case.execute("/path/to/doc.pdf")
+        captured_statuses = configured_mocks["document_repo"].save._statuses
 
-        # document_repo.save should be called at least 4 times:
+        # document_repo.save should be called exactly twice:
         # 1. After initial save (UPLOADED)
-        # 2. After start_processing (PROCESSING)
-        # 3. After mark_parsed (PARSED)
-        # 4. After mark_indexed (INDEXED)
-        assert len(captured_statuses) >= 4
-        assert DocumentStatus.UPLOADED in captured_statuses
-        assert DocumentStatus.PROCESSING in captured_statuses
-        assert DocumentStatus.PARSED in captured_statuses
-        assert DocumentStatus.INDEXED in captured_statuses
+        # 2. After mark_indexed (INDEXED)
+        assert len(captured_statuses) == 2
+        assert DocumentStatus.PROCESSING not in captured_statuses
+        assert DocumentStatus.PARSED not in captured_statuses
 
 
 class TestDocumentProcessorErrorHandling:
     """Tests for error handling in the document processing pipeline."""
 
-    @pytest.mark.asyncio
-    async def test_execute_marks_failed_on_parser_error(self, mock_dependencies):
+    async def test_execute_marks_failed_on_parser_error(self, use_case, mock_dependencies):
         """When file_parser.parse raises an exception, document status should be FAILED."""
         mock_dependencies["file_parser"].parse.side_effect = Exception("File not found")
-        use_case = DocumentProcessorUseCase(**mock_dependencies)
 
         result = await use_case.execute("/path/to/missing.pdf")
 
@@ -237,17 +303,13 @@ class TestDocumentProcessorErrorHandling:
         assert "File not found" in result.error
 
         # document_repo.save should still be called to persist the failed state
-        mock_dependencies["document_repo"].save.assert_called()
-        last_save_call = mock_dependencies["document_repo"].save.call_args_list[-1]
-        assert last_save_call[0][0].status == DocumentStatus.FAILED
+        assert mock_dependencies["document_repo"]._saved[-1].status == DocumentStatus.FAILED
 
-    @pytest.mark.asyncio
-    async def test_execute_marks_failed_on_llm_error(self, mock_dependencies, prompt_template):
+    async def test_execute_marks_failed_on_llm_error(self, use_case, mock_dependencies, prompt_template):
         """When llm_service.generate raises an exception, document should be marked as FAILED."""
         mock_dependencies["file_parser"].parse.return_value = "Some raw text"
         mock_dependencies["prompt_repo"].load.return_value = prompt_template
         mock_dependencies["llm_service"].generate.side_effect = Exception("LLM service unavailable")
-        use_case = DocumentProcessorUseCase(**mock_dependencies)
 
         result = await use_case.execute("/path/to/doc.pdf")
 
@@ -255,6 +317,131 @@ class TestDocumentProcessorErrorHandling:
         assert "LLM service unavailable" in result.error
 
         # document_repo.save should still be called to persist the failed state
-        mock_dependencies["document_repo"].save.assert_called()
-        last_save_call = mock_dependencies["document_repo"].save.call_args_list[-1]
-        assert last_save_call[0][0].status == DocumentStatus.FAILED
+        assert mock_dependencies["document_repo"]._saved[-1].status == DocumentStatus.FAILED
+
+
+class TestDocumentProcessorBackgroundQueue:
+    """Tests for queueing documents for background processing.
+
+    These tests use their own use case instance so the queue state does not
+    leak into the shared module-scoped one.
+    """
+
+    async def test_enqueue_saves_uploaded_document_without_processing(self, configured_mocks):
+        """enqueue should persist an UPLOADED document and return before the pipeline runs."""
+        use_case = DocumentProcessorUseCase(**configured_mocks)
+
+        result = await use_case.enqueue("/path/to/queued.pdf")
+
+        assert result.status == DocumentStatus.UPLOADED
+        assert result.filename == "queued.pdf"
+        configured_mocks["document_repo"].save.assert_called_once_with(result)
+        configured_mocks["file_parser"].parse.assert_not_called()
+
+    async def test_run_worker_processes_queued_documents(self, configured_mocks):
+        """The worker should run the pipeline for each queued document."""
+        use_case = DocumentProcessorUseCase(**configured_mocks)
+        document = await use_case.enqueue("/path/to/queued.pdf")
+
+        worker = asyncio.create_task(use_case.run_worker())
+        try:
+            await asyncio.wait_for(use_case._queue.join(), timeout=1.0)
+        finally:
+            worker.cancel()
+
+        assert document.status == DocumentStatus.INDEXED
+        configured_mocks["file_parser"].parse.assert_called_once_with("/path/to/queued.pdf")
+        configured_mocks["event_dispatcher"].dispatch.assert_called_once()
+
+    async def test_run_worker_survives_failing_job(self, configured_mocks):
+        """A job whose saves keep failing must not stop the worker from processing the next one."""
+        use_case = DocumentProcessorUseCase(**configured_mocks)
+        broken = await use_case.enqueue("/path/to/broken.pdf")
+        healthy = await use_case.enqueue("/path/to/healthy.pdf")
+
+        def save(document: Document) -> None:
+            if document is broken:
+                raise RuntimeError("db down")
+
+        configured_mocks["document_repo"].save.side_effect = save
+
+        worker = asyncio.create_task(use_case.run_worker())
+        try:
+            await asyncio.wait_for(use_case._queue.join(), timeout=1.0)
+            assert not worker.done()
+        finally:
+            worker.cancel()
+
+        assert healthy.status == DocumentStatus.INDEXED
+        assert use_case._queue.qsize() == 0
+
+
+class TestDocumentProcessorSplitText:
+    """Tests for splitting raw text into embedding chunks."""
+
+    def test_split_text_empty_returns_empty_list(self, use_case):
+        assert use_case._split_text("") == []
+
+    def test_split_text_chunks_by_size(self, use_case):
+        assert use_case._split_text("abcdefg", chunk_size=3, overlap=0) == ["abc", "def", "g"]
+
+    def test_split_text_overlaps_consecutive_chunks(self, use_case):
+        assert use_case._split_text("abcdefgh", chunk_size=4, overlap=2) == ["abcd", "cdef", "efgh"]
+
+    def test_split_text_prefers_sentence_boundaries(self, use_case):
+        text = "First sentence. Second one here."
+        chunks = use_case._split_text(text, chunk_size=20, overlap=0)
+        assert chunks[0] == "First sentence. "
+        assert "".join(chunks) == text
+
+    def test_split_text_prepends_section_heading(self, use_case):
+        text = "# Intro\n" + "a" * 10 + "\n## Details\n" + "b" * 10
+        chunks = use_case._split_text(text, chunk_size=12, overlap=0)
+        assert chunks[0].startswith("# Intro\n")
+        assert all(chunk.startswith("#") for chunk in chunks)
+        assert chunks[-1].startswith("## Details\nbbb")
+
+    def test_split_text_keeps_heading_only_document(self, use_case):
+        assert use_case._split_text("# Title") == ["# Title"]
+
+    def test_split_text_carries_empty_section_heading_forward(self, use_case):
+        assert use_case._split_text("# A\n## B\ntext") == ["# A\n## B\ntext"]
+
+
+class TestDocumentProcessorParseGraphData:
+    """Tests for parsing the entity extraction LLM response."""
+
+    async def test_parse_graph_data_builds_entities_and_relationships(self, use_case):
+        llm_response = (
+            '{"entities": [{"name": "Python", "type": "Language", "description": "A language"}], '
+            '"relationships": [{"source": "Python", "target": "FastAPI", "relation_type": "USED_BY", '
+            '"description": "FastAPI is built on Python"}]}'
+        )
+
+        graph_data = await use_case._parse_graph_data(llm_response)
+
+        assert graph_data.entity_count == 1
+        assert graph_data.find_entity("Python").type == "Language"
+        assert graph_data.relationships[0].relation_type == "USED_BY"
+
+    async def test_parse_graph_data_ignores_surrounding_text(self, use_case):
+        llm_response = '```json\n{"entities": [{"name": "Test", "type": "concept"}]}\n```'
+
+        graph_data = await use_case._parse_graph_data(llm_response)
+
+        assert graph_data.find_entity("Test") is not None
+        assert graph_data.relationship_count == 0
+
+    async def test_parse_graph_data_invalid_json_returns_empty(self, use_case):
+        graph_data = await use_case._parse_graph_data("no json here {not valid}")
+
+        assert graph_data == GraphData()
+
+    @pytest.mark.parametrize(
+        "llm_response",
+        ['{"entities": 5, "relationships": "abc"}', '{"entities": {"name": "X"}, "relationships": 1}'],
+    )
+    async def test_parse_graph_data_non_list_values_return_empty(self, use_case, llm_response):
+        graph_data = await use_case._parse_graph_data(llm_response)
+
+        assert graph_data == GraphData()
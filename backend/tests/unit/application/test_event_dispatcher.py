@@ -1,55 +1,51 @@
 """Tests for EventDispatcher - concrete implementation of IEventDispatcher."""
 
+import asyncio
 from unittest.mock import AsyncMock
 
-import pytest
 from src.application.event_dispatcher import EventDispatcher
-from src.domain.events import DocumentUploadedEvent, DomainEvent
+from src.domain.events import DocumentUploadedEvent, DomainEvent, FileDetectedEvent
+
+# Events are immutable, so one instance is shared by every test
+_EVENT = DocumentUploadedEvent(document_id="doc-1", filename="test.pdf")
 
 
 class TestEventDispatcherRegisterAndDispatch:
     """Tests for registering handlers and dispatching events."""
 
-    @pytest.mark.asyncio
     async def test_registered_handler_is_called_on_matching_event(self):
         """A registered handler should be called when a matching event is dispatched."""
         dispatcher = EventDispatcher()
         handler = AsyncMock()
-        event = DocumentUploadedEvent(document_id="doc-1", filename="test.pdf")
 
         dispatcher.register(DocumentUploadedEvent, handler)
-        await dispatcher.dispatch(event)
+        await dispatcher.dispatch(_EVENT)
 
-        handler.assert_called_once_with(event)
+        handler.assert_called_once_with(_EVENT)
 
-    @pytest.mark.asyncio
     async def test_dispatch_with_no_handlers_does_not_raise(self):
         """Dispatching an event with no registered handlers should not raise an error."""
         dispatcher = EventDispatcher()
-        event = DocumentUploadedEvent(document_id="doc-1", filename="test.pdf")
 
         # Should not raise any exception
-        await dispatcher.dispatch(event)
+        await dispatcher.dispatch(_EVENT)
 
-    @pytest.mark.asyncio
     async def test_multiple_handlers_all_called(self):
         """All registered handlers for an event type should be called."""
         dispatcher = EventDispatcher()
         handler_1 = AsyncMock()
         handler_2 = AsyncMock()
         handler_3 = AsyncMock()
-        event = DocumentUploadedEvent(document_id="doc-1", filename="test.pdf")
 
         dispatcher.register(DocumentUploadedEvent, handler_1)
         dispatcher.register(DocumentUploadedEvent, handler_2)
         dispatcher.register(DocumentUploadedEvent, handler_3)
-        await dispatcher.dispatch(event)
+        await dispatcher.dispatch(_EVENT)
 
-        handler_1.assert_called_once_with(event)
-        handler_2.assert_called_once_with(event)
-        handler_3.assert_called_once_with(event)
+        handler_1.assert_called_once_with(_EVENT)
+        handler_2.assert_called_once_with(_EVENT)
+        handler_3.assert_called_once_with(_EVENT)
 
-    @pytest.mark.asyncio
     async def test_async_handler_is_awaited(self):
         """Async handler functions should be awaited correctly."""
         dispatcher = EventDispatcher()
@@ -58,16 +54,13 @@ class TestEventDispatcherRegisterAndDispatch:
         async def async_handler(event: DomainEvent) -> None:
             call_log.append(("async", event))
 
-        event = DocumentUploadedEvent(document_id="doc-1", filename="test.pdf")
-
         dispatcher.register(DocumentUploadedEvent, async_handler)
-        await dispatcher.dispatch(event)
+        await dispatcher.dispatch(_EVENT)
 
         assert len(call_log) == 1
         assert call_log[0][0] == "async"
-        assert call_log[0][1] == event
+        assert call_log[0][1] == _EVENT
 
-    @pytest.mark.asyncio
     async def test_sync_handler_is_called(self):
         """Synchronous handler functions should be called correctly."""
         dispatcher = EventDispatcher()
@@ -76,18 +69,30 @@ class TestEventDispatcherRegisterAndDispatch:
         def sync_handler(event: DomainEvent) -> None:
             call_log.append(("sync", event))
 
-        event = DocumentUploadedEvent(document_id="doc-1", filename="test.pdf")
-
         dispatcher.register(DocumentUploadedEvent, sync_handler)
-        await dispatcher.dispatch(event)
+        await dispatcher.dispatch(_EVENT)
 
         assert len(call_log) == 1
         assert call_log[0][0] == "sync"
-        assert call_log[0][1] == event
+        assert call_log[0][1] == _EVENT
 
-    @pytest.mark.asyncio
     async def test_handlers_only_fire_for_registered_event_type(self):
-        """Handlers should only fire for their registered event type, not other types."""
+        """Handlers should not fire for unrelated event types."""
+        dispatcher = EventDispatcher()
+        uploaded_handler = AsyncMock()
+        detected_handler = AsyncMock()
+
+        dispatcher.register(DocumentUploadedEvent, uploaded_handler)
+        dispatcher.register(FileDetectedEvent, detected_handler)
+
+        # Dispatch a DocumentUploadedEvent - only uploaded_handler should fire
+        await dispatcher.dispatch(_EVENT)
+
+        uploaded_handler.assert_called_once_with(_EVENT)
+        detected_handler.assert_not_called()
+
+    async def test_base_type_handler_fires_for_subclass_event(self):
+        """A handler registered for DomainEvent should also receive subclass events."""
         dispatcher = EventDispatcher()
         uploaded_handler = AsyncMock()
         domain_handler = AsyncMock()
@@ -95,14 +100,33 @@ class TestEventDispatcherRegisterAndDispatch:
         dispatcher.register(DocumentUploadedEvent, uploaded_handler)
         dispatcher.register(DomainEvent, domain_handler)
 
-        # Dispatch a DocumentUploadedEvent - only uploaded_handler should fire
-        event = DocumentUploadedEvent(document_id="doc-1", filename="test.pdf")
-        await dispatcher.dispatch(event)
+        await dispatcher.dispatch(_EVENT)
 
-        uploaded_handler.assert_called_once_with(event)
-        domain_handler.assert_not_called()
+        uploaded_handler.assert_called_once_with(_EVENT)
+        domain_handler.assert_called_once_with(_EVENT)
+
+    async def test_subclass_handlers_run_before_base_handlers(self):
+        """Handlers for the most specific event type should run first."""
+        dispatcher = EventDispatcher()
+        call_log = []
+
+        dispatcher.register(DomainEvent, lambda event: call_log.append("domain"))
+        dispatcher.register(DocumentUploadedEvent, lambda event: call_log.append("uploaded"))
+        await dispatcher.dispatch(_EVENT)
+
+        assert call_log == ["uploaded", "domain"]
+
+    async def test_register_after_dispatch_invalidates_cache(self):
+        """Handlers registered after a dispatch should be picked up by later dispatches."""
+        dispatcher = EventDispatcher()
+        handler = AsyncMock()
+
+        await dispatcher.dispatch(_EVENT)
+        dispatcher.register(DomainEvent, handler)
+        await dispatcher.dispatch(_EVENT)
+
+        handler.assert_called_once_with(_EVENT)
 
-    @pytest.mark.asyncio
     async def test_dispatch_domain_event_does_not_trigger_uploaded_handler(self):
         """A DomainEvent dispatch should not trigger DocumentUploadedEvent handlers."""
         dispatcher = EventDispatcher()
@@ -115,3 +139,99 @@ class TestEventDispatcherRegisterAndDispatch:
         await dispatcher.dispatch(base_event)
 
         uploaded_handler.assert_not_called()
+
+
+class TestEventDispatcherIsolation:
+    """Tests that handler registrations are scoped to a dispatcher instance."""
+
+    async def test_handlers_are_not_shared_between_dispatchers(self):
+        """A handler registered on one dispatcher should not fire on another."""
+        dispatcher = EventDispatcher()
+        other_dispatcher = EventDispatcher()
+        handler = AsyncMock()
+
+        dispatcher.register(DocumentUploadedEvent, handler)
+        await other_dispatcher.dispatch(_EVENT)
+
+        handler.assert_not_called()
+
+
+class TestEventDispatcherConcurrency:
+    """Tests for concurrent execution of async handlers."""
+
+    async def test_async_handlers_run_concurrently(self):
+        """Async handlers should overlap instead of being awaited one after another."""
+        dispatcher = EventDispatcher()
+        started = asyncio.Event()
+        call_log = []
+
+        async def waiting_handler(event: DomainEvent) -> None:
+            await asyncio.wait_for(started.wait(), timeout=1.0)
+            call_log.append("waiting")
+
+        async def signalling_handler(event: DomainEvent) -> None:
+            started.set()
+            call_log.append("signalling")
+
+        dispatcher.register(DocumentUploadedEvent, waiting_handler)
+        dispatcher.register(DocumentUploadedEvent, signalling_handler)
+        await dispatcher.dispatch(_EVENT)
+
+        assert call_log == ["signalling", "waiting"]
+
+    async def test_sync_handlers_run_before_async_handlers(self):
+        """Sync handlers should run inline before async handlers are scheduled."""
+        dispatcher = EventDispatcher()
+        call_log = []
+
+        async def async_handler(event: DomainEvent) -> None:
+            call_log.append("async")
+
+        def sync_handler(event: DomainEvent) -> None:
+            call_log.append("sync")
+
+        dispatcher.register(DocumentUploadedEvent, async_handler)
+        dispatcher.register(DocumentUploadedEvent, sync_handler)
+        await dispatcher.dispatch(_EVENT)
+
+        assert call_log == ["sync", "async"]
+
+    async def test_failing_async_handler_does_not_abort_others(self):
+        """An exception in one async handler should not prevent other handlers from running."""
+        dispatcher = EventDispatcher()
+        failing_handler = AsyncMock(side_effect=RuntimeError("handler failed"))
+        handler = AsyncMock()
+
+        dispatcher.register(DocumentUploadedEvent, failing_handler)
+        dispatcher.register(DocumentUploadedEvent, handler)
+        await dispatcher.dispatch(_EVENT)
+
+        failing_handler.assert_called_once_with(_EVENT)
+        handler.assert_called_once_with(_EVENT)
+
+    async def test_failing_single_async_handler_does_not_raise(self):
+        """A lone failing async handler should be logged, not propagated."""
+        dispatcher = EventDispatcher()
+        failing_handler = AsyncMock(side_effect=RuntimeError("handler failed"))
+
+        dispatcher.register(DocumentUploadedEvent, failing_handler)
+        await dispatcher.dispatch(_EVENT)
+
+        failing_handler.assert_called_once()
+
+    async def test_failing_sync_handler_does_not_abort_async_handlers(self):
+        """A raising sync handler should be logged and must not stop async handlers registered before it."""
+        dispatcher = EventDispatcher()
+        call_log = []
+
+        async def async_handler(event: DomainEvent) -> None:
+            call_log.append("async")
+
+        def failing_sync_handler(event: DomainEvent) -> None:
+            raise RuntimeError("handler failed")
+
+        dispatcher.register(DocumentUploadedEvent, async_handler)
+        dispatcher.register(DocumentUploadedEvent, failing_sync_handler)
+        await dispatcher.dispatch(_EVENT)
+
+        assert call_log == ["async"]
@@ -0,0 +1,60 @@
+import itertools
+import sys
+from dataclasses import replace
+
+import pytest
+from src.domain.models.document import Document
+from src.domain.models.graph_data import Entity, GraphData, Relationship
+
+# Built once; make_doc copies it so each test skips the uuid4/now() default factories
+_DOC_TEMPLATE = Document(filename="test.pdf", content="content")
+_doc_ids = itertools.count(1)
+
+# Call sequences that walk a freshly uploaded Document into each named state
+_STATE_PATHS = {
+    "uploaded": (),
+    "processing": (lambda d: d.start_processing(),),
+    "parsed": (lambda d: d.start_processing(), lambda d: d.mark_parsed("parsed")),
+    "indexed": (lambda d: d.start_processing(), lambda d: d.mark_parsed("parsed"), lambda d: d.mark_indexed()),
+    "failed": (lambda d: d.mark_failed("error"),),
+}
+
+
+@pytest.fixture
+def make_doc():
+    """Factory returning a new Document advanced to the named state."""
+
+    def _make(state: str = "uploaded") -> Document:
+        doc = replace(_DOC_TEMPLATE, id=f"doc-{next(_doc_ids)}", metadata={})
+        for step in _STATE_PATHS[state]:
+            step(doc)
+        return doc
+
+    return _make
+
+
+def _entity(name: str, type_: str, description: str) -> Entity:
+    """Build an Entity with its name and type interned, as they repeat across graphs."""
+    return Entity(name=sys.intern(name), type=sys.intern(type_), description=description)
+
+
+def _relationship(source: str, target: str, relation_type: str, description: str) -> Relationship:
+    """Build a Relationship with its endpoint names and type interned."""
+    return Relationship(
+        source=sys.intern(source),
+        target=sys.intern(target),
+        relation_type=sys.intern(relation_type),
+        description=description,
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_graph() -> GraphData:
+    """Populated GraphData shared across tests; safe to reuse because it is immutable."""
+    return GraphData(
+        entities=(
+            _entity("Python", "Language", "A language"),
+            _entity("FastAPI", "Framework", "A framework"),
+        ),
+        relationships=(_relationship("Python", "FastAPI", "USED_BY", "Python is used by FastAPI"),),
+    )
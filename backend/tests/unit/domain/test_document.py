@@ -1,14 +1,21 @@
 """Tests for Document entity domain model."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 
 import pytest
+from hypothesis import settings
+from hypothesis import strategies as st
+from hypothesis.stateful import RuleBasedStateMachine, initialize, invariant, precondition, rule
 from src.domain.models.document import (
     Document,
     DocumentStatus,
     InvalidStateTransitionError,
 )
 
+pytestmark = pytest.mark.pure
+
+_CREATED_AT = datetime(2026, 1, 1, 12, 0, 0, tzinfo=UTC)
+
 
 class TestDocumentCreation:
     """Tests for Document entity creation."""
@@ -27,14 +34,13 @@ class TestDocumentCreation:
         assert doc.error is None
 
     def test_create_document_with_all_fields(self):
-        now = datetime(2026, 1, 1, 12, 0, 0)
         doc = Document(
             id="custom-id",
             filename="report.pdf",
             content="Full content here",
             status=DocumentStatus.UPLOADED,
             metadata={"author": "Alice"},
-            created_at=now,
+            created_at=_CREATED_AT,
         )
 
         assert doc.id == "custom-id"
@@ -42,7 +48,7 @@ class TestDocumentCreation:
         assert doc.content == "Full content here"
         assert doc.status == DocumentStatus.UPLOADED
         assert doc.metadata == {"author": "Alice"}
-        assert doc.created_at == now
+        assert doc.created_at == _CREATED_AT
 
     def test_create_document_generates_unique_ids(self):
         doc1 = Document(filename="a.pdf", content="a")
@@ -50,132 +56,117 @@ class TestDocumentCreation:
 
         assert doc1.id != doc2.id
 
+    def test_create_document_id_is_32_char_hex(self):
+        doc = Document(filename="a.pdf", content="a")
+
+        assert len(doc.id) == 32
+        int(doc.id, 16)
+
     def test_create_document_with_empty_filename_raises_value_error(self):
         with pytest.raises(ValueError, match="filename cannot be empty"):
             Document(filename="", content="content")
 
-    def test_create_document_default_status_is_uploaded(self):
-        doc = Document(filename="test.pdf", content="content")
+    def test_create_document_default_status_is_uploaded(self, make_doc):
+        doc = make_doc()
         assert doc.status == DocumentStatus.UPLOADED
 
+    def test_document_rejects_undeclared_attributes(self, make_doc):
+        doc = make_doc()
 
-class TestDocumentStateTransitions:
-    """Tests for Document state machine transitions."""
-
-    def test_start_processing_from_uploaded(self):
-        doc = Document(filename="test.pdf", content="content")
-        assert doc.status == DocumentStatus.UPLOADED
+        with pytest.raises(AttributeError):
+            doc.unknown = "value"
 
-        doc.start_processing()
 
-        assert doc.status == DocumentStatus.PROCESSING
+# Positional arguments for the transition methods that take one
+_ACTION_ARGS = {"mark_parsed": ("parsed",), "mark_failed": ("error",)}
 
-    def test_mark_parsed_from_processing(self):
-        doc = Document(filename="test.pdf", content="content")
-        doc.start_processing()
+_ACTION_NAMES = ("start_processing", "mark_parsed", "mark_indexed", "mark_failed")
 
-        doc.mark_parsed("Parsed text content")
+# Transition methods each status accepts; every other method must be rejected
+_ALLOWED_ACTIONS = {
+    DocumentStatus.UPLOADED: {"start_processing", "mark_failed"},
+    DocumentStatus.PROCESSING: {"mark_parsed", "mark_failed"},
+    DocumentStatus.PARSED: {"mark_indexed", "mark_failed"},
+    DocumentStatus.INDEXED: {"mark_failed"},
+    DocumentStatus.FAILED: set(),
+}
 
-        assert doc.status == DocumentStatus.PARSED
-        assert doc.parsed_content == "Parsed text content"
+_INVALID_TRANSITIONS = [
+    ("uploaded", "mark_indexed"),
+    ("uploaded", "mark_parsed"),
+    ("processing", "mark_indexed"),
+    ("parsed", "start_processing"),
+    ("indexed", "start_processing"),
+    ("failed", "start_processing"),
+    ("failed", "mark_failed"),
+]
 
-    def test_mark_indexed_from_parsed(self):
-        doc = Document(filename="test.pdf", content="content")
-        doc.start_processing()
-        doc.mark_parsed("parsed")
 
-        doc.mark_indexed()
+def _apply(doc: Document, action: str) -> None:
+    getattr(doc, action)(*_ACTION_ARGS.get(action, ()))
 
-        assert doc.status == DocumentStatus.INDEXED
 
-    def test_mark_failed_from_uploaded(self):
-        doc = Document(filename="test.pdf", content="content")
+class DocumentStateMachine(RuleBasedStateMachine):
+    """Walks a Document through random transition sequences, checking rejected moves too."""
 
-        doc.mark_failed("Upload validation error")
+    @initialize()
+    def create(self):
+        self.doc = Document(filename="test.pdf", content="content")
 
-        assert doc.status == DocumentStatus.FAILED
-        assert doc.error == "Upload validation error"
+    @precondition(lambda self: self.doc.status == DocumentStatus.UPLOADED)
+    @rule()
+    def start_processing(self):
+        self.doc.start_processing()
+        assert self.doc.status == DocumentStatus.PROCESSING
 
-    def test_mark_failed_from_processing(self):
-        doc = Document(filename="test.pdf", content="content")
-        doc.start_processing()
+    @precondition(lambda self: self.doc.status == DocumentStatus.PROCESSING)
+    @rule(content=st.text(max_size=20))
+    def mark_parsed(self, content):
+        self.doc.mark_parsed(content)
+        assert self.doc.status == DocumentStatus.PARSED
+        assert self.doc.parsed_content == content
 
-        doc.mark_failed("Processing error")
+    @precondition(lambda self: self.doc.status == DocumentStatus.PARSED)
+    @rule()
+    def mark_indexed(self):
+        self.doc.mark_indexed()
+        assert self.doc.status == DocumentStatus.INDEXED
 
-        assert doc.status == DocumentStatus.FAILED
-        assert doc.error == "Processing error"
+    @precondition(lambda self: self.doc.status != DocumentStatus.FAILED)
+    @rule(error=st.text(max_size=20))
+    def mark_failed(self, error):
+        self.doc.mark_failed(error)
+        assert self.doc.status == DocumentStatus.FAILED
+        assert self.doc.error == error
 
-    def test_mark_failed_from_parsed(self):
-        doc = Document(filename="test.pdf", content="content")
-        doc.start_processing()
-        doc.mark_parsed("parsed")
+    @rule(data=st.data())
+    def reject_disallowed_transition(self, data):
+        status_before = self.doc.status
+        action = data.draw(st.sampled_from(sorted(set(_ACTION_NAMES) - _ALLOWED_ACTIONS[status_before])))
 
-        doc.mark_failed("Indexing error")
+        with pytest.raises(InvalidStateTransitionError):
+            _apply(self.doc, action)
 
-        assert doc.status == DocumentStatus.FAILED
-        assert doc.error == "Indexing error"
+        assert self.doc.status == status_before
 
-    def test_mark_failed_from_indexed(self):
-        doc = Document(filename="test.pdf", content="content")
-        doc.start_processing()
-        doc.mark_parsed("parsed")
-        doc.mark_indexed()
+    @invariant()
+    def error_only_when_failed(self):
+        assert (self.doc.error is not None) == (self.doc.status == DocumentStatus.FAILED)
 
-        doc.mark_failed("Post-index error")
 
-        assert doc.status == DocumentStatus.FAILED
-        assert doc.error == "Post-index error"
+DocumentStateMachine.TestCase.settings = settings(max_examples=50, stateful_step_count=6, deadline=None)
+TestDocumentStateTransitions = DocumentStateMachine.TestCase
 
 
 class TestDocumentInvalidTransitions:
     """Tests for invalid state transitions that should raise errors."""
 
-    def test_cannot_transition_from_uploaded_to_indexed(self):
-        doc = Document(filename="test.pdf", content="content")
-
-        with pytest.raises(InvalidStateTransitionError):
-            doc.mark_indexed()
-
-    def test_cannot_transition_from_uploaded_to_parsed(self):
-        doc = Document(filename="test.pdf", content="content")
-
-        with pytest.raises(InvalidStateTransitionError):
-            doc.mark_parsed("parsed")
-
-    def test_cannot_transition_from_processing_to_indexed(self):
-        doc = Document(filename="test.pdf", content="content")
-        doc.start_processing()
-
-        with pytest.raises(InvalidStateTransitionError):
-            doc.mark_indexed()
-
-    def test_cannot_start_processing_from_parsed(self):
-        doc = Document(filename="test.pdf", content="content")
-        doc.start_processing()
-        doc.mark_parsed("parsed")
-
-        with pytest.raises(InvalidStateTransitionError):
-            doc.start_processing()
-
-    def test_cannot_start_processing_from_indexed(self):
-        doc = Document(filename="test.pdf", content="content")
-        doc.start_processing()
-        doc.mark_parsed("parsed")
-        doc.mark_indexed()
-
-        with pytest.raises(InvalidStateTransitionError):
-            doc.start_processing()
-
-    def test_cannot_transition_from_failed(self):
-        doc = Document(filename="test.pdf", content="content")
-        doc.mark_failed("error")
+    @pytest.mark.parametrize("state, action", _INVALID_TRANSITIONS)
+    def test_invalid_transition_raises(self, make_doc, state, action):
+        doc = make_doc(state)
+        status_before = doc.status
 
         with pytest.raises(InvalidStateTransitionError):
-            doc.start_processing()
-
-    def test_cannot_mark_failed_from_failed(self):
-        doc = Document(filename="test.pdf", content="content")
-        doc.mark_failed("first error")
+            _apply(doc, action)
 
-        with pytest.raises(InvalidStateTransitionError):
-            doc.mark_failed("second error")
+        assert doc.status == status_before
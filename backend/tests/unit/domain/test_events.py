@@ -1,10 +1,17 @@
 """Tests for domain events."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 
 import pytest
+import time_machine
 from src.domain.events import DocumentUploadedEvent, DomainEvent
 
+pytestmark = pytest.mark.pure
+
+_FROZEN_AT = datetime(2026, 1, 1, tzinfo=UTC)
+_DOMAIN_EVENT_TIME = datetime(2026, 6, 15, 10, 30, 0, tzinfo=UTC)
+_UPLOADED_EVENT_TIME = datetime(2026, 3, 1, 8, 0, 0, tzinfo=UTC)
+
 
 class TestDomainEvent:
     """Tests for DomainEvent base class."""
@@ -14,24 +21,27 @@ class TestDomainEvent:
 
         assert isinstance(event.occurred_at, datetime)
 
-    def test_domain_event_auto_sets_occurred_at(self):
-        before = datetime.utcnow()
+    def test_domain_event_occurred_at_is_utc_aware(self):
         event = DomainEvent()
-        after = datetime.utcnow()
 
-        assert before <= event.occurred_at <= after
+        assert event.occurred_at.tzinfo is UTC
+
+    def test_domain_event_auto_sets_occurred_at(self):
+        with time_machine.travel(_FROZEN_AT, tick=False):
+            event = DomainEvent()
+
+        assert event.occurred_at == _FROZEN_AT
 
     def test_domain_event_with_explicit_occurred_at(self):
-        specific_time = datetime(2026, 6, 15, 10, 30, 0)
-        event = DomainEvent(occurred_at=specific_time)
+        event = DomainEvent(occurred_at=_DOMAIN_EVENT_TIME)
 
-        assert event.occurred_at == specific_time
+        assert event.occurred_at == _DOMAIN_EVENT_TIME
 
     def test_domain_event_is_immutable(self):
         event = DomainEvent()
 
         with pytest.raises(AttributeError):
-            event.occurred_at = datetime(2026, 1, 1)
+            event.occurred_at = _FROZEN_AT
 
 
 class TestDocumentUploadedEvent:
@@ -48,24 +58,22 @@ class TestDocumentUploadedEvent:
         assert isinstance(event.occurred_at, datetime)
 
     def test_document_uploaded_event_auto_sets_occurred_at(self):
-        before = datetime.utcnow()
-        event = DocumentUploadedEvent(
-            document_id="doc-456",
-            filename="data.csv",
-        )
-        after = datetime.utcnow()
+        with time_machine.travel(_FROZEN_AT, tick=False):
+            event = DocumentUploadedEvent(
+                document_id="doc-456",
+                filename="data.csv",
+            )
 
-        assert before <= event.occurred_at <= after
+        assert event.occurred_at == _FROZEN_AT
 
     def test_document_uploaded_event_with_explicit_occurred_at(self):
-        specific_time = datetime(2026, 3, 1, 8, 0, 0)
         event = DocumentUploadedEvent(
             document_id="doc-789",
             filename="notes.txt",
-            occurred_at=specific_time,
+            occurred_at=_UPLOADED_EVENT_TIME,
         )
 
-        assert event.occurred_at == specific_time
+        assert event.occurred_at == _UPLOADED_EVENT_TIME
 
     def test_document_uploaded_event_is_immutable(self):
         event = DocumentUploadedEvent(
@@ -79,6 +87,11 @@ class TestDocumentUploadedEvent:
         with pytest.raises(AttributeError):
             event.filename = "modified.pdf"
 
+    def test_document_uploaded_event_has_no_instance_dict(self):
+        event = DocumentUploadedEvent(document_id="doc-123", filename="report.pdf")
+
+        assert not hasattr(event, "__dict__")
+
     def test_document_uploaded_event_inherits_from_domain_event(self):
         event = DocumentUploadedEvent(
             document_id="doc-123",
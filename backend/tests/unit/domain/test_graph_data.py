@@ -1,8 +1,13 @@
 """Tests for GraphData, Entity, and Relationship value objects."""
 
+import copy
+from dataclasses import asdict, fields
+
 import pytest
 from src.domain.models.graph_data import Entity, GraphData, Relationship
 
+pytestmark = pytest.mark.pure
+
 
 class TestEntityCreation:
     """Tests for Entity value object."""
@@ -24,6 +29,11 @@ class TestEntityCreation:
         with pytest.raises(AttributeError):
             entity.name = "Java"
 
+    def test_entity_has_no_instance_dict(self):
+        entity = Entity(name="Python", type="Language", description="desc")
+
+        assert not hasattr(entity, "__dict__")
+
 
 class TestRelationshipCreation:
     """Tests for Relationship value object."""
@@ -47,28 +57,18 @@ class TestRelationshipCreation:
         with pytest.raises(AttributeError):
             rel.source = "C"
 
+    def test_relationship_has_no_instance_dict(self):
+        rel = Relationship(source="A", target="B", relation_type="RELATES", description="desc")
 
-class TestGraphDataCreation:
-    """Tests for GraphData value object."""
+        assert not hasattr(rel, "__dict__")
 
-    def test_create_graph_data_with_entities_and_relationships(self):
-        entities = (
-            Entity(name="Python", type="Language", description="A language"),
-            Entity(name="FastAPI", type="Framework", description="A framework"),
-        )
-        relationships = (
-            Relationship(
-                source="Python",
-                target="FastAPI",
-                relation_type="USED_BY",
-                description="Python is used by FastAPI",
-            ),
-        )
 
-        graph = GraphData(entities=entities, relationships=relationships)
+class TestGraphDataCreation:
+    """Tests for GraphData value object."""
 
-        assert len(graph.entities) == 2
-        assert len(graph.relationships) == 1
+    def test_create_graph_data_with_entities_and_relationships(self, sample_graph):
+        assert len(sample_graph.entities) == 2
+        assert len(sample_graph.relationships) == 1
 
     def test_create_empty_graph_data(self):
         graph = GraphData()
@@ -82,32 +82,22 @@ class TestGraphDataCreation:
         with pytest.raises(AttributeError):
             graph.entities = ()
 
+    def test_graph_data_has_no_instance_dict(self, sample_graph):
+        assert not hasattr(sample_graph, "__dict__")
+
 
 class TestGraphDataProperties:
     """Tests for GraphData computed properties."""
 
-    def test_entity_count(self):
-        entities = (
-            Entity(name="A", type="Type", description="desc"),
-            Entity(name="B", type="Type", description="desc"),
-            Entity(name="C", type="Type", description="desc"),
-        )
-        graph = GraphData(entities=entities)
-
-        assert graph.entity_count == 3
+    def test_entity_count(self, sample_graph):
+        assert sample_graph.entity_count == 2
 
     def test_entity_count_empty(self):
         graph = GraphData()
         assert graph.entity_count == 0
 
-    def test_relationship_count(self):
-        relationships = (
-            Relationship(source="A", target="B", relation_type="R", description="d"),
-            Relationship(source="B", target="C", relation_type="R", description="d"),
-        )
-        graph = GraphData(relationships=relationships)
-
-        assert graph.relationship_count == 2
+    def test_relationship_count(self, sample_graph):
+        assert sample_graph.relationship_count == 1
 
     def test_relationship_count_empty(self):
         graph = GraphData()
@@ -117,22 +107,15 @@ class TestGraphDataProperties:
 class TestGraphDataFindEntity:
     """Tests for GraphData.find_entity method."""
 
-    def test_find_entity_returns_matching_entity(self):
-        entity_python = Entity(name="Python", type="Language", description="A language")
-        entity_fastapi = Entity(name="FastAPI", type="Framework", description="A framework")
-        graph = GraphData(entities=(entity_python, entity_fastapi))
-
-        found = graph.find_entity("Python")
+    def test_find_entity_returns_matching_entity(self, sample_graph):
+        found = sample_graph.find_entity("Python")
 
         assert found is not None
         assert found.name == "Python"
         assert found.type == "Language"
 
-    def test_find_entity_returns_none_when_not_found(self):
-        entity = Entity(name="Python", type="Language", description="A language")
-        graph = GraphData(entities=(entity,))
-
-        found = graph.find_entity("Java")
+    def test_find_entity_returns_none_when_not_found(self, sample_graph):
+        found = sample_graph.find_entity("Java")
 
         assert found is None
 
@@ -142,3 +125,27 @@ class TestGraphDataFindEntity:
         found = graph.find_entity("anything")
 
         assert found is None
+
+    def test_find_entity_returns_first_entity_with_duplicate_name(self):
+        first = Entity(name="Python", type="Language", description="first")
+        second = Entity(name="Python", type="Snake", description="second")
+        graph = GraphData(entities=(first, second))
+
+        assert graph.find_entity("Python") is first
+
+    def test_graph_data_equality_and_hash_ignore_index(self):
+        entities = (Entity(name="Python", type="Language", description="A language"),)
+
+        assert GraphData(entities=entities) == GraphData(entities=entities)
+        assert hash(GraphData(entities=entities)) == hash(GraphData(entities=entities))
+
+    def test_graph_data_exposes_only_entities_and_relationships(self, sample_graph):
+        sample_graph.find_entity("Python")
+
+        assert [f.name for f in fields(sample_graph)] == ["entities", "relationships"]
+        assert set(asdict(sample_graph)) == {"entities", "relationships"}
+
+    def test_find_entity_on_copy(self, sample_graph):
+        sample_graph.find_entity("Python")
+
+        assert copy.copy(sample_graph).find_entity("FastAPI").type == "Framework"
@@ -6,10 +6,13 @@ PromptTemplate value object, PromptType enum, and PromptLoader utility.
 
 from __future__ import annotations
 
+import copy
+import os
+import pickle
+from dataclasses import asdict
 from pathlib import Path
 
 import pytest
-import yaml
 from src.core.prompt_loader import PromptLoader
 from src.domain.models.prompt import PromptTemplate, PromptType
 
@@ -18,17 +21,20 @@ from src.domain.models.prompt import PromptTemplate, PromptType
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.pure
 class TestPromptType:
     """PromptType enum must expose the three supported prompt categories."""
 
-    def test_entity_extraction_value(self) -> None:
-        assert PromptType.ENTITY_EXTRACTION.value == "entity_extraction"
-
-    def test_search_query_value(self) -> None:
-        assert PromptType.SEARCH_QUERY.value == "search_query"
-
-    def test_summarization_value(self) -> None:
-        assert PromptType.SUMMARIZATION.value == "summarization"
+    @pytest.mark.parametrize(
+        "member, expected",
+        [
+            (PromptType.ENTITY_EXTRACTION, "entity_extraction"),
+            (PromptType.SEARCH_QUERY, "search_query"),
+            (PromptType.SUMMARIZATION, "summarization"),
+        ],
+    )
+    def test_member_value(self, member: PromptType, expected: str) -> None:
+        assert member.value == expected
 
     def test_enum_members_count(self) -> None:
         """Exactly three members should exist."""
@@ -40,6 +46,7 @@ class TestPromptType:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.pure
 class TestPromptTemplateCreation:
     """PromptTemplate must be a frozen (immutable) dataclass with validation."""
 
@@ -48,21 +55,27 @@ class TestPromptTemplateCreation:
             name="test_prompt",
             template="Hello {{name}}",
             version="1.0",
-            variables=["name"],
+            variables=("name",),
         )
         assert pt.name == "test_prompt"
         assert pt.template == "Hello {{name}}"
         assert pt.version == "1.0"
-        assert pt.variables == ["name"]
+        assert pt.variables == ("name",)
 
     def test_create_with_default_variables(self) -> None:
-        """variables should default to an empty list."""
+        """variables should default to an empty tuple."""
         pt = PromptTemplate(
             name="simple",
             template="No variables here",
             version="0.1",
         )
-        assert pt.variables == []
+        assert pt.variables == ()
+
+    def test_is_hashable(self) -> None:
+        """With tuple variables, equal templates hash equally."""
+        a = PromptTemplate(name="h", template="{{x}}", version="1.0", variables=("x",))
+        b = PromptTemplate(name="h", template="{{x}}", version="1.0", variables=("x",))
+        assert hash(a) == hash(b)
 
     def test_frozen_immutability(self) -> None:
         """PromptTemplate instances must be immutable."""
@@ -74,12 +87,26 @@ class TestPromptTemplateCreation:
         with pytest.raises(AttributeError):
             pt.name = "changed"  # type: ignore[misc]
 
+    def test_has_no_instance_dict(self) -> None:
+        pt = PromptTemplate(name="slots", template="content", version="1.0")
+        assert not hasattr(pt, "__dict__")
+
+    def test_derived_values_are_not_fields(self) -> None:
+        pt = PromptTemplate(name="shape", template="{{x}}", version="1.0", variables=("x",))
+        assert set(asdict(pt)) == {"name", "template", "version", "variables"}
+
+    def test_copy_is_renderable(self) -> None:
+        pt = PromptTemplate(name="copy", template="{{x}}", version="1.0", variables=("x",))
+        assert copy.copy(pt).render(x="y") == "y"
+        assert pickle.loads(pickle.dumps(pt)).render(x="z") == "z"
+
 
 # ---------------------------------------------------------------------------
 # PromptTemplate validation
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.pure
 class TestPromptTemplateValidation:
     """Empty name or template must raise ValueError."""
 
@@ -107,6 +134,7 @@ class TestPromptTemplateValidation:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.pure
 class TestPromptTemplateRender:
     """render() substitutes {{variable}} placeholders with provided values."""
 
@@ -115,7 +143,7 @@ class TestPromptTemplateRender:
             name="greeting",
             template="Hello {{name}}!",
             version="1.0",
-            variables=["name"],
+            variables=("name",),
         )
         assert pt.render(name="World") == "Hello World!"
 
@@ -124,7 +152,7 @@ class TestPromptTemplateRender:
             name="multi",
             template="{{greeting}}, {{name}}! You are {{age}} years old.",
             version="1.0",
-            variables=["greeting", "name", "age"],
+            variables=("greeting", "name", "age"),
         )
         result = pt.render(greeting="Hi", name="Alice", age=30)
         assert result == "Hi, Alice! You are 30 years old."
@@ -135,7 +163,7 @@ class TestPromptTemplateRender:
             name="number",
             template="Count: {{n}}",
             version="1.0",
-            variables=["n"],
+            variables=("n",),
         )
         assert pt.render(n=42) == "Count: 42"
 
@@ -145,7 +173,7 @@ class TestPromptTemplateRender:
             name="static",
             template="Static content",
             version="1.0",
-            variables=[],
+            variables=(),
         )
         assert pt.render() == "Static content"
 
@@ -154,7 +182,7 @@ class TestPromptTemplateRender:
             name="need_vars",
             template="{{a}} and {{b}}",
             version="1.0",
-            variables=["a", "b"],
+            variables=("a", "b"),
         )
         with pytest.raises(ValueError, match="Missing required variables"):
             pt.render(a="only_a")
@@ -164,7 +192,7 @@ class TestPromptTemplateRender:
             name="need_vars",
             template="{{x}} {{y}}",
             version="1.0",
-            variables=["x", "y"],
+            variables=("x", "y"),
         )
         with pytest.raises(ValueError, match="Missing required variables"):
             pt.render()
@@ -175,7 +203,7 @@ class TestPromptTemplateRender:
             name="extra",
             template="Hello {{name}}",
             version="1.0",
-            variables=["name"],
+            variables=("name",),
         )
         result = pt.render(name="Bob", unused="value")
         assert result == "Hello Bob"
@@ -186,122 +214,202 @@ class TestPromptTemplateRender:
             name="multiline",
             template="Line1: {{a}}\nLine2: {{b}}\n",
             version="1.0",
-            variables=["a", "b"],
+            variables=("a", "b"),
         )
         result = pt.render(a="foo", b="bar")
         assert result == "Line1: foo\nLine2: bar\n"
 
+    def test_render_tolerates_whitespace_inside_braces(self) -> None:
+        pt = PromptTemplate(
+            name="spaced",
+            template="Hello {{ name }}!",
+            version="1.0",
+            variables=("name",),
+        )
+        assert pt.render(name="World") == "Hello World!"
+
+    def test_render_leaves_spaced_unknown_placeholders_untouched(self) -> None:
+        pt = PromptTemplate(
+            name="spaced_unknown",
+            template="{{ a }} {{ other }} {{other}}",
+            version="1.0",
+            variables=("a",),
+        )
+        assert pt.render(a="foo") == "foo {{ other }} {{other}}"
+
+    def test_render_keeps_literal_braces(self) -> None:
+        """Single braces such as JSON examples in the template are not format fields."""
+        pt = PromptTemplate(
+            name="json",
+            template='Return {"entities": [{{text}}]}',
+            version="1.0",
+            variables=("text",),
+        )
+        assert pt.render(text="x") == 'Return {"entities": [x]}'
+
+    @pytest.mark.benchmark(group="prompt")
+    def test_render_throughput(self, benchmark) -> None:
+        """Regression benchmark for render(), which runs on every LLM call."""
+        pt = PromptTemplate(
+            name="bench",
+            template="{{a}} {{b}} {{c}}",
+            version="1.0",
+            variables=("a", "b", "c"),
+        )
+        assert benchmark(pt.render, a="1", b="2", c="3") == "1 2 3"
+
+    def test_render_does_not_substitute_inside_values(self) -> None:
+        """Placeholders appearing in substituted values must not be expanded again."""
+        pt = PromptTemplate(
+            name="nested",
+            template="{{a}} / {{b}}",
+            version="1.0",
+            variables=("a", "b"),
+        )
+        assert pt.render(a="{{b}}", b="bar") == "{{b}} / bar"
+
+    def test_render_leaves_unknown_placeholders(self) -> None:
+        """Placeholders without a matching kwarg are left as-is."""
+        pt = PromptTemplate(
+            name="unknown",
+            template="{{a}} {{other}}",
+            version="1.0",
+            variables=("a",),
+        )
+        assert pt.render(a="foo") == "foo {{other}}"
+
 
 # ---------------------------------------------------------------------------
 # PromptLoader — YAML loading
 # ---------------------------------------------------------------------------
 
 
-def _write_yaml(path: Path, data: dict | str) -> None:
-    """Helper to write YAML content to a file."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        if isinstance(data, str):
-            f.write(data)
-        else:
-            yaml.dump(data, f, allow_unicode=True)
+@pytest.fixture(scope="session")
+def prompts_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory of canonical, well-formed prompt files shared by read-only load tests."""
+    d = tmp_path_factory.mktemp("prompts")
+    (d / "entity_extraction.yaml").write_text(
+        "name: entity_extraction\n"
+        'version: "1.0"\n'
+        "variables: [text, language]\n"
+        'template: "Extract entities from: {{text}} ({{language}})"\n',
+        encoding="utf-8",
+    )
+    (d / "search_query.yaml").write_text(
+        "name: search_query\n"
+        'version: "1.0"\n'
+        "variables: [query, context]\n"
+        'template: "Query: {{query}}\\nContext: {{context}}"\n',
+        encoding="utf-8",
+    )
+    (d / "summarization.yaml").write_text(
+        'name: summarization\nversion: "1.0"\ntemplate: Summarize this text.\n',
+        encoding="utf-8",
+    )
+    return d
 
 
 class TestPromptLoaderLoad:
     """PromptLoader.load() must read a YAML file and return a PromptTemplate."""
 
-    def test_load_valid_yaml(self, tmp_path: Path) -> None:
-        data = {
-            "name": "entity_extraction",
-            "version": "1.0",
-            "variables": ["text", "language"],
-            "template": "Extract entities from: {{text}} ({{language}})",
-        }
-        _write_yaml(tmp_path / "entity_extraction.yaml", data)
-        loader = PromptLoader(prompts_dir=tmp_path)
+    def test_load_valid_yaml(self, prompts_dir: Path) -> None:
+        loader = PromptLoader(prompts_dir=prompts_dir)
         pt = loader.load(PromptType.ENTITY_EXTRACTION)
 
         assert pt.name == "entity_extraction"
         assert pt.version == "1.0"
-        assert pt.variables == ["text", "language"]
+        assert pt.variables == ("text", "language")
         assert "{{text}}" in pt.template
 
-    def test_load_returns_prompt_template_instance(self, tmp_path: Path) -> None:
-        data = {
-            "name": "search_query",
-            "version": "1.0",
-            "variables": ["query"],
-            "template": "Search: {{query}}",
-        }
-        _write_yaml(tmp_path / "search_query.yaml", data)
-        loader = PromptLoader(prompts_dir=tmp_path)
+    def test_load_returns_prompt_template_instance(self, prompts_dir: Path) -> None:
+        loader = PromptLoader(prompts_dir=prompts_dir)
         pt = loader.load(PromptType.SEARCH_QUERY)
         assert isinstance(pt, PromptTemplate)
 
-    def test_load_without_variables_defaults_to_empty(self, tmp_path: Path) -> None:
-        data = {
-            "name": "summarization",
-            "version": "1.0",
-            "template": "Summarize this text.",
-        }
-        _write_yaml(tmp_path / "summarization.yaml", data)
-        loader = PromptLoader(prompts_dir=tmp_path)
+    def test_load_without_variables_defaults_to_empty(self, prompts_dir: Path) -> None:
+        loader = PromptLoader(prompts_dir=prompts_dir)
         pt = loader.load(PromptType.SUMMARIZATION)
-        assert pt.variables == []
+        assert pt.variables == ()
 
     def test_load_file_not_found_raises(self, tmp_path: Path) -> None:
         loader = PromptLoader(prompts_dir=tmp_path)
         with pytest.raises(FileNotFoundError):
             loader.load(PromptType.ENTITY_EXTRACTION)
 
-    def test_load_invalid_yaml_raises(self, tmp_path: Path) -> None:
+    def test_load_invalid_yaml_raises(self) -> None:
         """Malformed YAML (non-dict top-level) should raise ValueError."""
-        bad_yaml = "- this\n- is\n- a list\n"
-        _write_yaml(tmp_path / "entity_extraction.yaml", bad_yaml)
-        loader = PromptLoader(prompts_dir=tmp_path)
+        loader = PromptLoader(source=lambda _: "- this\n- is\n- a list\n")
         with pytest.raises(ValueError, match="Invalid YAML"):
             loader.load(PromptType.ENTITY_EXTRACTION)
 
-    def test_load_missing_name_raises(self, tmp_path: Path) -> None:
-        data = {
-            "version": "1.0",
-            "template": "Hello",
-        }
-        _write_yaml(tmp_path / "entity_extraction.yaml", data)
-        loader = PromptLoader(prompts_dir=tmp_path)
+    def test_load_missing_name_raises(self) -> None:
+        loader = PromptLoader(source=lambda _: 'version: "1.0"\ntemplate: Hello\n')
         with pytest.raises(ValueError, match="name"):
             loader.load(PromptType.ENTITY_EXTRACTION)
 
-    def test_load_missing_template_raises(self, tmp_path: Path) -> None:
-        data = {
-            "name": "entity_extraction",
-            "version": "1.0",
-        }
-        _write_yaml(tmp_path / "entity_extraction.yaml", data)
-        loader = PromptLoader(prompts_dir=tmp_path)
+    def test_load_missing_template_raises(self) -> None:
+        loader = PromptLoader(source=lambda _: 'name: entity_extraction\nversion: "1.0"\n')
         with pytest.raises(ValueError, match="template"):
             loader.load(PromptType.ENTITY_EXTRACTION)
 
-    def test_load_missing_version_raises(self, tmp_path: Path) -> None:
-        data = {
-            "name": "entity_extraction",
-            "template": "Hello",
-        }
-        _write_yaml(tmp_path / "entity_extraction.yaml", data)
-        loader = PromptLoader(prompts_dir=tmp_path)
+    def test_load_missing_version_raises(self) -> None:
+        loader = PromptLoader(source=lambda _: "name: entity_extraction\ntemplate: Hello\n")
         with pytest.raises(ValueError, match="version"):
             loader.load(PromptType.ENTITY_EXTRACTION)
 
-    def test_loaded_template_is_renderable(self, tmp_path: Path) -> None:
+    def test_load_from_source_passes_prompt_type(self) -> None:
+        """An injected source is asked for the requested type instead of reading a file."""
+        requested: list[PromptType] = []
+
+        def source(prompt_type: PromptType) -> str:
+            requested.append(prompt_type)
+            return 'name: summarization\nversion: "1.0"\ntemplate: Summarize this text.\n'
+
+        pt = PromptLoader(source=source).load(PromptType.SUMMARIZATION)
+
+        assert requested == [PromptType.SUMMARIZATION]
+        assert pt.name == "summarization"
+
+    def test_loaded_template_is_renderable(self, prompts_dir: Path) -> None:
         """End-to-end: load from YAML, then render with variables."""
-        data = {
-            "name": "search_query",
-            "version": "1.0",
-            "variables": ["query", "context"],
-            "template": "Query: {{query}}\nContext: {{context}}",
-        }
-        _write_yaml(tmp_path / "search_query.yaml", data)
-        loader = PromptLoader(prompts_dir=tmp_path)
+        loader = PromptLoader(prompts_dir=prompts_dir)
         pt = loader.load(PromptType.SEARCH_QUERY)
         result = pt.render(query="test question", context="some context")
         assert result == "Query: test question\nContext: some context"
+
+    def test_load_caches_template_per_prompt_type(self, tmp_path: Path) -> None:
+        """A second load of the same type should not re-read the YAML file."""
+        path = tmp_path / "search_query.yaml"
+        path.write_text('name: search_query\nversion: "1.0"\ntemplate: "Search: {{query}}"\n', encoding="utf-8")
+        loader = PromptLoader(prompts_dir=tmp_path)
+        first = loader.load(PromptType.SEARCH_QUERY)
+
+        path.unlink()
+        second = loader.load(PromptType.SEARCH_QUERY)
+
+        assert second is first
+
+    def test_load_shares_parsed_yaml_across_loaders(self, tmp_path: Path) -> None:
+        """Loaders pointing at the same file should parse it only once."""
+        (tmp_path / "summarization.yaml").write_text(
+            'name: summarization\nversion: "1.0"\ntemplate: Summarize this text.\n', encoding="utf-8"
+        )
+        PromptLoader._load_yaml.cache_clear()
+
+        PromptLoader(prompts_dir=tmp_path).load(PromptType.SUMMARIZATION)
+        PromptLoader(prompts_dir=tmp_path).load(PromptType.SUMMARIZATION)
+
+        info = PromptLoader._load_yaml.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_new_loader_rereads_edited_file(self, tmp_path: Path) -> None:
+        """Editing a prompt file must be picked up by a loader created afterwards."""
+        path = tmp_path / "summarization.yaml"
+        path.write_text('name: summarization\nversion: "1.0"\ntemplate: OLD\n', encoding="utf-8")
+        assert PromptLoader(prompts_dir=tmp_path).load(PromptType.SUMMARIZATION).template == "OLD"
+
+        path.write_text('name: summarization\nversion: "1.0"\ntemplate: NEW\n', encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert PromptLoader(prompts_dir=tmp_path).load(PromptType.SUMMARIZATION).template == "NEW"
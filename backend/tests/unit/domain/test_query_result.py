@@ -3,6 +3,8 @@
 import pytest
 from src.domain.models.query_result import QueryResult
 
+pytestmark = pytest.mark.pure
+
 
 class TestQueryResultCreation:
     """Tests for QueryResult value object creation."""
@@ -68,48 +70,25 @@ class TestQueryResultCreation:
         assert result.score == 1.0
 
 
+_VALID_KWARGS = {"query": "test", "answer": "answer", "sources": (), "score": 0.5, "rag_type": "vector"}
+
+
 class TestQueryResultValidation:
     """Tests for QueryResult validation."""
 
-    def test_invalid_rag_type_raises_value_error(self):
-        with pytest.raises(ValueError, match="rag_type must be 'vector' or 'graph'"):
-            QueryResult(
-                query="test",
-                answer="answer",
-                sources=(),
-                score=0.5,
-                rag_type="hybrid",
-            )
-
-    def test_empty_rag_type_raises_value_error(self):
-        with pytest.raises(ValueError, match="rag_type must be 'vector' or 'graph'"):
-            QueryResult(
-                query="test",
-                answer="answer",
-                sources=(),
-                score=0.5,
-                rag_type="",
-            )
-
-    def test_score_below_zero_raises_value_error(self):
-        with pytest.raises(ValueError, match="score must be between 0.0 and 1.0"):
-            QueryResult(
-                query="test",
-                answer="answer",
-                sources=(),
-                score=-0.1,
-                rag_type="vector",
-            )
-
-    def test_score_above_one_raises_value_error(self):
-        with pytest.raises(ValueError, match="score must be between 0.0 and 1.0"):
-            QueryResult(
-                query="test",
-                answer="answer",
-                sources=(),
-                score=1.1,
-                rag_type="vector",
-            )
+    @pytest.mark.parametrize(
+        "override, match",
+        [
+            ({"rag_type": "hybrid"}, "rag_type must be 'vector' or 'graph'"),
+            ({"rag_type": ""}, "rag_type must be 'vector' or 'graph'"),
+            ({"score": -0.1}, "score must be between 0.0 and 1.0"),
+            ({"score": 1.1}, "score must be between 0.0 and 1.0"),
+        ],
+        ids=["invalid_rag_type", "empty_rag_type", "score_below_zero", "score_above_one"],
+    )
+    def test_invalid_field_raises_value_error(self, override, match):
+        with pytest.raises(ValueError, match=match):
+            QueryResult(**{**_VALID_KWARGS, **override})
 
 
 class TestQueryResultImmutability:
@@ -132,3 +111,23 @@ class TestQueryResultImmutability:
 
         with pytest.raises(AttributeError):
             result.rag_type = "graph"
+
+    def test_query_result_has_no_instance_dict(self):
+        result = QueryResult(**_VALID_KWARGS)
+
+        assert not hasattr(result, "__dict__")
+
+
+class TestQueryResultUnchecked:
+    """Tests for the validation-free constructor used by repositories."""
+
+    def test_unchecked_equals_validated_instance(self):
+        kwargs = {"query": "q", "answer": "a", "sources": ("doc1",), "score": 0.5, "rag_type": "vector"}
+
+        assert QueryResult.unchecked(**kwargs) == QueryResult(**kwargs)
+
+    def test_unchecked_skips_validation(self):
+        result = QueryResult.unchecked(query="q", answer="a", sources=(), score=2.0, rag_type="hybrid")
+
+        assert result.score == 2.0
+        assert result.rag_type == "hybrid"
@@ -19,7 +19,6 @@ class TestPyMuPDFFileParserInterface:
 class TestPyMuPDFFileParserTxtParsing:
     """Tests for parsing plain text files."""
 
-    @pytest.mark.asyncio
     async def test_parse_txt_file_returns_content(self, tmp_path):
         """Parsing a .txt file should return its text content."""
         txt_file = tmp_path / "sample.txt"
@@ -30,7 +29,6 @@ class TestPyMuPDFFileParserTxtParsing:
 
         assert result == "Hello, world!"
 
-    @pytest.mark.asyncio
     async def test_parse_txt_file_with_multiline_content(self, tmp_path):
         """Parsing a multi-line .txt file should preserve all lines."""
         content = "Line 1\nLine 2\nLine 3"
@@ -42,7 +40,6 @@ class TestPyMuPDFFileParserTxtParsing:
 
         assert result == content
 
-    @pytest.mark.asyncio
     async def test_parse_txt_file_with_utf8_content(self, tmp_path):
         """Parsing a .txt file with UTF-8 characters should work correctly."""
         content = "日本語テスト"
@@ -58,7 +55,6 @@ class TestPyMuPDFFileParserTxtParsing:
 class TestPyMuPDFFileParserPdfParsing:
     """Tests for parsing PDF files."""
 
-    @pytest.mark.asyncio
     async def test_parse_pdf_file_returns_text(self, tmp_path):
         """Parsing a PDF file should extract its text content."""
         pdf_path = tmp_path / "test.pdf"
@@ -73,7 +69,6 @@ class TestPyMuPDFFileParserPdfParsing:
 
         assert "Test content" in result
 
-    @pytest.mark.asyncio
     async def test_parse_pdf_with_multiple_pages(self, tmp_path):
         """Parsing a multi-page PDF should extract text from all pages."""
         pdf_path = tmp_path / "multipage.pdf"
@@ -95,7 +90,6 @@ class TestPyMuPDFFileParserPdfParsing:
 class TestPyMuPDFFileParserErrorHandling:
     """Tests for error handling."""
 
-    @pytest.mark.asyncio
     async def test_parse_nonexistent_file_raises_file_not_found_error(self):
         """Parsing a nonexistent file should raise FileNotFoundError."""
         parser = PyMuPDFFileParser()
@@ -103,7 +97,6 @@ class TestPyMuPDFFileParserErrorHandling:
         with pytest.raises(FileNotFoundError, match="File not found"):
             await parser.parse("/nonexistent/path/file.pdf")
 
-    @pytest.mark.asyncio
     async def test_parse_unsupported_csv_raises_value_error(self, tmp_path):
         """Parsing a .csv file should raise ValueError for unsupported type."""
         csv_file = tmp_path / "data.csv"
@@ -114,7 +107,6 @@ class TestPyMuPDFFileParserErrorHandling:
         with pytest.raises(ValueError, match="Unsupported file type: .csv"):
             await parser.parse(str(csv_file))
 
-    @pytest.mark.asyncio
     async def test_parse_unsupported_xlsx_raises_value_error(self, tmp_path):
         """Parsing a .xlsx file should raise ValueError for unsupported type."""
         xlsx_file = tmp_path / "data.xlsx"
@@ -125,7 +117,6 @@ class TestPyMuPDFFileParserErrorHandling:
         with pytest.raises(ValueError, match="Unsupported file type: .xlsx"):
             await parser.parse(str(xlsx_file))
 
-    @pytest.mark.asyncio
     async def test_parse_unsupported_docx_raises_value_error(self, tmp_path):
         """Parsing a .docx file should raise ValueError for unsupported type."""
         docx_file = tmp_path / "doc.docx"
@@ -4,7 +4,7 @@ import pytest
 
 pytest.importorskip("watchdog", reason="watchdog not installed")
 
-from datetime import datetime
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.domain.events import DomainEvent, FileDetectedEvent
@@ -51,9 +51,9 @@ class TestFileDetectedEvent:
         assert event.filename == ""
 
     def test_file_detected_event_auto_sets_occurred_at(self):
-        before = datetime.utcnow()
+        before = datetime.now(UTC)
         event = FileDetectedEvent(file_path="/tmp/test.txt", filename="test.txt")
-        after = datetime.utcnow()
+        after = datetime.now(UTC)
 
         assert before <= event.occurred_at <= after
 
@@ -137,7 +137,6 @@ class TestFileSystemWatcherStop:
 class TestOnFileCreated:
     """Tests for FileSystemWatcher._on_file_created dispatch logic."""
 
-    @pytest.mark.asyncio
     async def test_on_file_created_dispatches_file_detected_event(self):
         dispatcher = AsyncMock()
         watcher = FileSystemWatcher("/tmp/uploads", dispatcher)
@@ -150,7 +149,6 @@ class TestOnFileCreated:
         assert dispatched_event.file_path == "/tmp/uploads/report.pdf"
         assert dispatched_event.filename == "report.pdf"
 
-    @pytest.mark.asyncio
     async def test_on_file_created_sets_correct_filename_from_nested_path(self):
         dispatcher = AsyncMock()
         watcher = FileSystemWatcher("/tmp/uploads", dispatcher)
@@ -93,7 +93,6 @@ class TestGraphRAGRepositoryInterface:
 class TestGraphRAGRepositoryStoreGraph:
     """Tests for store_graph method."""
 
-    @pytest.mark.asyncio
     async def test_creates_entities_parquet(
         self, repo: GraphRAGRepository, sample_graph_data: GraphData, tmp_path: Path
     ) -> None:
@@ -103,7 +102,6 @@ class TestGraphRAGRepositoryStoreGraph:
         entities_path = tmp_path / "doc1" / "entities.parquet"
         assert entities_path.exists()
 
-    @pytest.mark.asyncio
     async def test_entities_parquet_has_correct_data(
         self, repo: GraphRAGRepository, sample_graph_data: GraphData, tmp_path: Path
     ) -> None:
@@ -116,7 +114,6 @@ class TestGraphRAGRepositoryStoreGraph:
         assert df.iloc[0]["name"] == "Python"
         assert df.iloc[1]["name"] == "FastAPI"
 
-    @pytest.mark.asyncio
     async def test_creates_relationships_parquet(
         self, repo: GraphRAGRepository, sample_graph_data: GraphData, tmp_path: Path
     ) -> None:
@@ -126,7 +123,6 @@ class TestGraphRAGRepositoryStoreGraph:
         relationships_path = tmp_path / "doc1" / "relationships.parquet"
         assert relationships_path.exists()
 
-    @pytest.mark.asyncio
     async def test_relationships_parquet_has_correct_data(
         self, repo: GraphRAGRepository, sample_graph_data: GraphData, tmp_path: Path
     ) -> None:
@@ -140,7 +136,6 @@ class TestGraphRAGRepositoryStoreGraph:
         assert df.iloc[0]["target"] == "Python"
         assert df.iloc[0]["relation_type"] == "BUILT_WITH"
 
-    @pytest.mark.asyncio
     async def test_creates_metadata_json(
         self, repo: GraphRAGRepository, sample_graph_data: GraphData, tmp_path: Path
     ) -> None:
@@ -157,7 +152,6 @@ class TestGraphRAGRepositoryStoreGraph:
         assert metadata["entity_count"] == 2
         assert metadata["relationship_count"] == 1
 
-    @pytest.mark.asyncio
     async def test_empty_graph_data_creates_metadata_only(
         self, repo: GraphRAGRepository, empty_graph_data: GraphData, tmp_path: Path
     ) -> None:
@@ -183,7 +177,6 @@ class TestGraphRAGRepositoryStoreGraph:
 class TestGraphRAGRepositoryGetGraphData:
     """Tests for get_graph_data method."""
 
-    @pytest.mark.asyncio
     async def test_returns_correct_entities(self, repo: GraphRAGRepository, sample_graph_data: GraphData) -> None:
         """get_graph_data should return GraphData with the stored entities."""
         await repo.store_graph("doc1", sample_graph_data)
@@ -196,7 +189,6 @@ class TestGraphRAGRepositoryGetGraphData:
         assert result.entities[0].type == "Language"
         assert result.entities[1].name == "FastAPI"
 
-    @pytest.mark.asyncio
     async def test_returns_correct_relationships(self, repo: GraphRAGRepository, sample_graph_data: GraphData) -> None:
         """get_graph_data should return GraphData with the stored relationships."""
         await repo.store_graph("doc1", sample_graph_data)
@@ -209,7 +201,6 @@ class TestGraphRAGRepositoryGetGraphData:
         assert result.relationships[0].target == "Python"
         assert result.relationships[0].relation_type == "BUILT_WITH"
 
-    @pytest.mark.asyncio
     async def test_returns_none_for_unknown_document(self, repo: GraphRAGRepository) -> None:
         """get_graph_data should return None when the document_id does not exist."""
         result = await repo.get_graph_data("nonexistent")
@@ -224,7 +215,6 @@ class TestGraphRAGRepositoryGetGraphData:
 class TestGraphRAGRepositorySearch:
     """Tests for search method."""
 
-    @pytest.mark.asyncio
     async def test_finds_entity_by_name(self, repo: GraphRAGRepository, sample_graph_data: GraphData) -> None:
         """search should find entities whose name matches the query."""
         await repo.store_graph("doc1", sample_graph_data)
@@ -234,7 +224,6 @@ class TestGraphRAGRepositorySearch:
         assert len(results) >= 1
         assert any("Python" in r.answer for r in results)
 
-    @pytest.mark.asyncio
     async def test_finds_entity_by_description(self, repo: GraphRAGRepository, sample_graph_data: GraphData) -> None:
         """search should find entities whose description contains the query."""
         await repo.store_graph("doc1", sample_graph_data)
@@ -244,7 +233,6 @@ class TestGraphRAGRepositorySearch:
         assert len(results) >= 1
         assert any("FastAPI" in r.answer for r in results)
 
-    @pytest.mark.asyncio
     async def test_returns_empty_list_when_no_matches(
         self, repo: GraphRAGRepository, sample_graph_data: GraphData
     ) -> None:
@@ -255,13 +243,11 @@ class TestGraphRAGRepositorySearch:
 
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_returns_empty_list_when_no_data(self, repo: GraphRAGRepository) -> None:
         """search should return an empty list when no documents are stored."""
         results = await repo.search("anything")
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_results_are_query_result_instances(
         self, repo: GraphRAGRepository, sample_graph_data: GraphData
     ) -> None:
@@ -275,7 +261,6 @@ class TestGraphRAGRepositorySearch:
             assert r.rag_type == "graph"
             assert r.query == "Python"
 
-    @pytest.mark.asyncio
     async def test_results_sorted_by_score_descending(self, repo: GraphRAGRepository) -> None:
         """search results should be sorted by score in descending order."""
         # Create data where one entity matches by name (score=1.0) and another by description (score=0.7)
@@ -295,7 +280,6 @@ class TestGraphRAGRepositorySearch:
         assert results[0].score == 1.0
         assert results[1].score == 0.7
 
-    @pytest.mark.asyncio
     async def test_search_is_case_insensitive(self, repo: GraphRAGRepository, sample_graph_data: GraphData) -> None:
         """search should be case-insensitive."""
         await repo.store_graph("doc1", sample_graph_data)
@@ -305,7 +289,6 @@ class TestGraphRAGRepositorySearch:
         assert len(results) >= 1
         assert any("Python" in r.answer for r in results)
 
-    @pytest.mark.asyncio
     async def test_search_includes_document_id_in_sources(
         self, repo: GraphRAGRepository, sample_graph_data: GraphData
     ) -> None:
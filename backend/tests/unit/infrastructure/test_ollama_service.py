@@ -49,7 +49,6 @@ class TestOllamaLLMServiceInterface:
 class TestOllamaLLMServiceGenerate:
     """Tests for OllamaLLMService.generate method."""
 
-    @pytest.mark.asyncio
     async def test_generate_sends_correct_request(self):
         """generate should POST to /api/generate with model, prompt, and stream=False."""
         mock_response = _make_response({"response": "Hello!"})
@@ -69,7 +68,6 @@ class TestOllamaLLMServiceGenerate:
             timeout=120.0,
         )
 
-    @pytest.mark.asyncio
     async def test_generate_returns_response_text(self):
         """generate should return the 'response' field from the JSON body."""
         mock_response = _make_response({"response": "The answer is 42."})
@@ -85,7 +83,6 @@ class TestOllamaLLMServiceGenerate:
 
         assert result == "The answer is 42."
 
-    @pytest.mark.asyncio
     async def test_generate_with_custom_base_url_and_model(self):
         """generate should use the custom base_url and model provided at init."""
         mock_response = _make_response({"response": "custom response"})
@@ -105,7 +102,6 @@ class TestOllamaLLMServiceGenerate:
             timeout=120.0,
         )
 
-    @pytest.mark.asyncio
     async def test_generate_raises_on_http_error(self):
         """generate should propagate httpx.HTTPStatusError when the API returns an error."""
         mock_response = _make_error_response(500)
@@ -137,7 +133,6 @@ class TestOllamaEmbeddingServiceInterface:
 class TestOllamaEmbeddingServiceCreateEmbeddings:
     """Tests for OllamaEmbeddingService.create_embeddings method."""
 
-    @pytest.mark.asyncio
     async def test_create_embeddings_returns_correct_vectors(self):
         """create_embeddings should return embedding vectors from the API response."""
         expected_embedding = [0.1, 0.2, 0.3, 0.4, 0.5]
@@ -154,7 +149,6 @@ class TestOllamaEmbeddingServiceCreateEmbeddings:
 
         assert result == [expected_embedding]
 
-    @pytest.mark.asyncio
     async def test_create_embeddings_sends_correct_request(self):
         """create_embeddings should POST to /api/embed with model and input."""
         mock_response = _make_response({"embeddings": [[0.1, 0.2]]})
@@ -174,7 +168,6 @@ class TestOllamaEmbeddingServiceCreateEmbeddings:
             timeout=60.0,
         )
 
-    @pytest.mark.asyncio
     async def test_create_embeddings_handles_multiple_texts(self):
         """create_embeddings should call the API once per text and return all embeddings."""
         responses = [
@@ -198,7 +191,6 @@ class TestOllamaEmbeddingServiceCreateEmbeddings:
         assert result[2] == [0.7, 0.8, 0.9]
         assert mock_client.post.call_count == 3
 
-    @pytest.mark.asyncio
     async def test_create_embeddings_with_empty_list(self):
         """create_embeddings with an empty list should return an empty list without API calls."""
         mock_client = AsyncMock(spec=httpx.AsyncClient)
@@ -213,7 +205,6 @@ class TestOllamaEmbeddingServiceCreateEmbeddings:
         assert result == []
         mock_client.post.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_create_embeddings_raises_on_http_error(self):
         """create_embeddings should propagate httpx.HTTPStatusError when the API returns an error."""
         mock_response = _make_error_response(500)
@@ -228,7 +219,6 @@ class TestOllamaEmbeddingServiceCreateEmbeddings:
             with pytest.raises(httpx.HTTPStatusError):
                 await service.create_embeddings(["will fail"])
 
-    @pytest.mark.asyncio
     async def test_create_embeddings_with_custom_base_url_and_model(self):
         """create_embeddings should use the custom base_url and model provided at init."""
         mock_response = _make_response({"embeddings": [[0.1]]})
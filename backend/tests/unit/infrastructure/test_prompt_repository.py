@@ -57,7 +57,7 @@ class TestPromptRepositoryLoadEntityExtraction:
     def test_has_correct_variables(self) -> None:
         repo = PromptRepository()
         result = repo.load(PromptType.ENTITY_EXTRACTION)
-        assert result.variables == ["text", "language"]
+        assert result.variables == ("text", "language")
 
     def test_template_contains_placeholders(self) -> None:
         repo = PromptRepository()
@@ -94,7 +94,7 @@ class TestPromptRepositoryLoadSearchQuery:
     def test_has_correct_variables(self) -> None:
         repo = PromptRepository()
         result = repo.load(PromptType.SEARCH_QUERY)
-        assert result.variables == ["query", "language"]
+        assert result.variables == ("query", "language")
 
     def test_template_contains_placeholders(self) -> None:
         repo = PromptRepository()
@@ -131,7 +131,7 @@ class TestPromptRepositoryLoadSummarization:
     def test_has_correct_variables(self) -> None:
         repo = PromptRepository()
         result = repo.load(PromptType.SUMMARIZATION)
-        assert result.variables == ["text", "language"]
+        assert result.variables == ("text", "language")
 
     def test_template_contains_placeholders(self) -> None:
         repo = PromptRepository()